@@ -249,7 +249,7 @@ def scan(ctx, source_path, output, config, verbosity, include_private, events,
         if exclude:
             cli_args['exclude_patterns'] = list(exclude)
         
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.instance()
         
         with console.status("[bold blue]Loading configuration..."):
             mdvis_config = config_manager.load_config(
@@ -340,7 +340,7 @@ def init(project_name, output, user, template):
     • User: ~/.config/mdvis/config.yaml (personal defaults)
     """
     try:
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.instance()
         
         if user:
             # Create user config
@@ -411,7 +411,7 @@ def validate(config_path, source, detailed):
       mdvis validate --source ./src
     """
     try:
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.instance()
         
         # Determine source path
         source_path = source or Path.cwd()
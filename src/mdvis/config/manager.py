@@ -5,19 +5,81 @@ Handles the priority chain: CLI Args → Project Config → User Config → Buil
 """
 
 import os
+import re
+import sys
 import yaml
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 from pydantic import ValidationError
 
 from .schema import MDVisConfig, get_default_config
 
+try:
+    # libyaml's C emitter is much faster than the pure-Python one
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+
+
+_CONFIG_HEADER = (
+    "# MDVis Configuration File\n"
+    "# This file contains project-specific settings for documentation generation.\n"
+    "\n"
+)
+
+# Comments emitted above each top-level section of a generated config file
+_SECTION_COMMENTS = {
+    'verbosity': "# Output verbosity: minimal, standard, or detailed",
+    'project': "# Project information",
+    'output': "# Output generation settings",
+    'analysis': "# Code analysis settings",
+    'events': "# Event system detection",
+    'visualization': "# Visualization generation",
+    'linting': "# Code linting during processing",
+}
+
+_SECTION_KEY_RE = re.compile(r'^(\w+):', re.MULTILINE)
+
+
+def _split_config_path(path: str) -> Tuple[str, ...]:
+    """Split a dotted config path into interned key segments."""
+    return tuple(sys.intern(key) for key in path.split('.'))
+
+
+# Map CLI args to (config path, optional value transform)
+_CLI_MAPPINGS: Dict[str, Tuple[Tuple[str, ...], Optional[Callable[[Any], Any]]]] = {
+    cli_key: (_split_config_path(path), transform)
+    for cli_key, path, transform in [
+        ('verbosity', 'verbosity', None),
+        ('include_private', 'output.include_private', None),
+        ('no_events', 'events.enabled', lambda x: not x),  # --no-events sets events.enabled=False
+        ('generate_diagrams', 'visualization.generate_dependency_graph', None),
+        ('exclude_patterns', 'project.exclude_patterns', None),
+        ('source_paths', 'project.source_paths', None),  # CLI source path override
+        ('source_position', 'output.source_position', None),
+        ('auto_format', 'linting.auto_format', None),
+        ('halt_on_errors', 'linting.halt_on_errors', None),
+    ]
+}
+
+
+def _insert_section_comment(match: "re.Match[str]") -> str:
+    """Prefix a top-level YAML key with its section comment, if any."""
+    comment = _SECTION_COMMENTS.get(match.group(1))
+    if comment is None:
+        return match.group(0)
+    prefix = "" if match.start() == 0 else "\n"
+    return f"{prefix}{comment}\n{match.group(0)}"
+
 
 class ConfigurationError(Exception):
     """Configuration-related error."""
     pass
 
 
+_INSTANCE: Optional["ConfigManager"] = None
+
+
 class ConfigManager:
     """
     Manages configuration loading and resolution with multiple layers.
@@ -34,6 +96,20 @@ class ConfigManager:
         self._cli_overrides: Dict[str, Any] = {}
         self._project_config_path: Optional[Path] = None
         self._user_config_path: Optional[Path] = None
+        self._config_dict_cache: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def instance(cls) -> "ConfigManager":
+        """
+        Get the shared, lazily created config manager.
+        
+        Long-lived callers (e.g. watch mode) should reuse this instance so
+        anything cached between loads survives across reloads.
+        """
+        global _INSTANCE
+        if _INSTANCE is None:
+            _INSTANCE = cls()
+        return _INSTANCE
     
     def load_config(
         self,
@@ -52,34 +128,49 @@ class ConfigManager:
         Returns:
             Resolved configuration
         """
+        # Forget sources from any previous load
+        self._cli_overrides = {}
+        self._project_config_path = None
+        self._user_config_path = None
+        
         # Start with built-in defaults
-        config_data = self._get_default_config_dict()
+        config = get_default_config()
+        config_data = config.dict()
+        overridden: Set[str] = set()
         
         # Layer 3: User config (if exists)
         user_config = self._load_user_config()
         if user_config:
             config_data = self._merge_config(config_data, user_config)
+            overridden.update(user_config)
         
         # Layer 2: Project config (if exists)
         project_config = self._load_project_config(project_root, config_file)
         if project_config:
             config_data = self._merge_config(config_data, project_config)
+            overridden.update(project_config)
         
         # Layer 1: CLI arguments (highest priority)
         if cli_args:
             self._cli_overrides = cli_args
-            config_data = self._apply_cli_overrides(config_data, cli_args)
-        
-        # Validate and create final config
+            self._apply_cli_overrides(config_data, cli_args)
+            overridden.update(
+                config_path[0] for cli_key, (config_path, _) in _CLI_MAPPINGS.items()
+                if cli_key in cli_args
+            )
+        
+        # Validate and create final config. The defaults are already valid, so
+        # only the overridden top-level sections are re-validated (on assignment).
         try:
-            self._config = MDVisConfig(**config_data)
-            return self._config
+            for name in MDVisConfig.model_fields:
+                if name in overridden:
+                    setattr(config, name, config_data[name])
         except ValidationError as e:
             raise ConfigurationError(f"Invalid configuration: {e}")
-    
-    def _get_default_config_dict(self) -> Dict[str, Any]:
-        """Get default configuration as dictionary."""
-        return get_default_config().dict()
+        
+        self._config = config
+        self._config_dict_cache = None
+        return self._config
     
     def _load_user_config(self) -> Optional[Dict[str, Any]]:
         """Load user-level configuration."""
@@ -168,44 +259,31 @@ class ConfigManager:
         
         return result
     
-    def _apply_cli_overrides(self, config: Dict[str, Any], cli_args: Dict[str, Any]) -> Dict[str, Any]:
+    def _apply_cli_overrides(self, config: Dict[str, Any], cli_args: Dict[str, Any]) -> None:
         """
-        Apply CLI argument overrides to configuration.
+        Apply CLI argument overrides to configuration in place.
         
         CLI args use flat keys that map to nested config structure.
         """
-        result = config.copy()
-        
-        # Map CLI args to config paths
-        cli_mappings = {
-            'verbosity': 'verbosity',
-            'include_private': 'output.include_private',
-            'no_events': ('events.enabled', lambda x: not x),  # --no-events sets events.enabled=False
-            'generate_diagrams': 'visualization.generate_dependency_graph',
-            'exclude_patterns': 'project.exclude_patterns',
-            'source_paths': 'project.source_paths',  # Add this mapping for CLI source path override
-            'source_position': 'output.source_position',
-            'auto_format': 'linting.auto_format',
-            'halt_on_errors': 'linting.halt_on_errors'
-        }
-        
-        for cli_key, config_path in cli_mappings.items():
+        for cli_key, (config_path, transform) in _CLI_MAPPINGS.items():
             if cli_key in cli_args:
                 value = cli_args[cli_key]
                 
                 # Handle special transformations
-                if isinstance(config_path, tuple):
-                    config_path, transform = config_path
+                if transform is not None:
                     value = transform(value)
                 
                 # Set nested value
-                self._set_nested_value(result, config_path, value)
-        
-        return result
+                self._set_nested_value(config, config_path, value)
     
-    def _set_nested_value(self, config: Dict[str, Any], path: str, value: Any) -> None:
-        """Set a nested configuration value using dot notation."""
-        keys = path.split('.')
+    def _set_nested_value(
+        self, 
+        config: Dict[str, Any], 
+        path: Union[str, Tuple[str, ...]], 
+        value: Any
+    ) -> None:
+        """Set a nested configuration value using dot notation or a key tuple."""
+        keys = _split_config_path(path) if isinstance(path, str) else path
         current = config
         
         # Navigate to parent dict
@@ -239,64 +317,25 @@ class ConfigManager:
     
     def _generate_commented_yaml(self, config: Dict[str, Any]) -> str:
         """Generate YAML with helpful comments."""
-        lines = [
-            "# MDVis Configuration File",
-            "# This file contains project-specific settings for documentation generation.",
-            "",
-            "# Output verbosity: minimal, standard, or detailed",
-            f"verbosity: {config['verbosity']}",
-            "",
-            "# Project information",
-            "project:",
-            f"  name: {config['project']['name'] or 'YourProject'}",
-            f"  description: {config['project']['description'] or 'Project description'}",
-            "  source_paths:",
-            "    - src",
-            "  exclude_patterns:",
-            "    - '**/test_*.py'",
-            "    - '**/tests/**'",
-            "    - '**/__pycache__/**'",
-            "",
-            "# Output generation settings",
-            "output:",
-            f"  structure: {config['output']['structure']}  # mirror or flatten",
-            f"  include_private: {str(config['output']['include_private']).lower()}",
-            f"  source_position: {config['output']['source_position']}  # top or bottom",
-            "",
-            "# Event system detection",
-            "events:",
-            f"  enabled: {str(config['events']['enabled']).lower()}",
-            f"  auto_detect: {str(config['events']['auto_detect']).lower()}",
-            "  # Add custom patterns here if needed",
-            "  patterns: []",
-            "",
-            "# Code analysis settings", 
-            "analysis:",
-            f"  detect_async_patterns: {str(config['analysis']['detect_async_patterns']).lower()}",
-            f"  detect_type_hints: {str(config['analysis']['detect_type_hints']).lower()}",
-            f"  calculate_complexity: {str(config['analysis']['calculate_complexity']).lower()}",
-            "",
-            "# Visualization generation",
-            "visualization:",
-            f"  generate_dependency_graph: {str(config['visualization']['generate_dependency_graph']).lower()}",
-            f"  generate_event_flow: {str(config['visualization']['generate_event_flow']).lower()}",
-            "",
-            "# Code linting during processing",
-            "linting:",
-            f"  enabled: {str(config['linting']['enabled']).lower()}",
-            f"  auto_format: {str(config['linting']['auto_format']).lower()}",
-            f"  halt_on_errors: {str(config['linting']['halt_on_errors']).lower()}"
-        ]
-        
-        return '\n'.join(lines)
+        body = yaml.dump(
+            config,
+            Dumper=_SafeDumper,
+            sort_keys=False,
+            default_flow_style=False,
+            allow_unicode=True
+        )
+        return _CONFIG_HEADER + _SECTION_KEY_RE.sub(_insert_section_comment, body)
     
     def get_config_info(self) -> Dict[str, Any]:
         """Get information about loaded configuration sources."""
+        if self._config_dict_cache is None and self._config:
+            self._config_dict_cache = self._config.dict()
+        
         return {
             'user_config_path': str(self._user_config_path) if self._user_config_path else None,
             'project_config_path': str(self._project_config_path) if self._project_config_path else None,
             'cli_overrides': self._cli_overrides,
-            'effective_config': self._config.dict() if self._config else None
+            'effective_config': self._config_dict_cache
         }
     
     @property
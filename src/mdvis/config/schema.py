@@ -17,6 +17,11 @@ class EventPatternConfig(BaseModel):
     publisher_patterns: List[str] = Field(..., description="Regex patterns for event publishers")
     subscriber_patterns: List[str] = Field(..., description="Regex patterns for event subscribers")
     extract_event_type: str = Field(..., description="Regex to extract event type from calls")
+    extract_from_call_text: bool = Field(
+        True,
+        description="Fall back to matching extract_event_type against the call's source text "
+                    "when no string argument matches (disable when event types are always literal arguments)"
+    )
     
     @field_validator('publisher_patterns', 'subscriber_patterns')
     @classmethod
@@ -62,6 +67,7 @@ class OutputConfig(BaseModel):
     source_position: Literal["top", "bottom"] = Field("bottom", description="Where to place source code")
     generate_toc: bool = Field(True, description="Generate table of contents")
     toc_style: Literal["collapsible", "standard"] = Field("standard", description="TOC style preference")
+    max_concurrent_writes: int = Field(4, ge=1, description="Concurrent writers for generated pages")
     
     model_config = {
         "json_schema_extra": {
@@ -166,6 +172,15 @@ class ProjectConfig(BaseModel):
         ],
         description="Patterns to exclude from scanning"
     )
+    parse_cache_dir: Optional[str] = Field(
+        None,
+        description="Directory for caching parsed modules between runs (disabled when unset)"
+    )
+    parse_workers: int = Field(
+        1,
+        ge=1,
+        description="Worker processes used for parsing (1 parses in the main process)"
+    )
     
     model_config = {
         "json_schema_extra": {
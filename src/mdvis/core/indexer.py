@@ -6,8 +6,11 @@ to enable smart cross-referencing in generated documentation.
 """
 
 import asyncio
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, List, Set, Optional, Tuple
 import logging
 
 from ..models.elements import Module, Class, Function, ImportStatement
@@ -18,6 +21,58 @@ from ..models.index import (
 
 logger = logging.getLogger(__name__)
 
+# (source module, target module, dependency type, example)
+DependencySpec = Tuple[str, str, ReferenceType, str]
+
+_BUILTIN_TYPES = frozenset({
+    'int', 'str', 'bool', 'float', 'list', 'dict', 'tuple', 'set', 'frozenset',
+    'bytes', 'bytearray', 'memoryview', 'complex', 'object', 'type', 'None'
+})
+
+_TYPING_TYPES = frozenset({
+    'List', 'Dict', 'Tuple', 'Set', 'FrozenSet', 'Optional', 'Union', 'Any',
+    'Callable', 'Iterable', 'Iterator', 'Generator', 'Coroutine', 'Awaitable',
+    'AsyncIterable', 'AsyncIterator', 'AsyncGenerator', 'Type', 'TypeVar',
+    'Generic', 'Protocol', 'Literal', 'Final', 'ClassVar'
+})
+
+
+def _builtin_type_resolution(type_name: str) -> TypeResolution:
+    """Resolution for a builtin type."""
+    return TypeResolution(type_name=type_name, is_builtin=True)
+
+
+def _typing_type_resolution(type_name: str) -> TypeResolution:
+    """Resolution for a typing module type."""
+    return TypeResolution(type_name=type_name, is_external=True)
+
+
+# Shared placeholder path for event-context refs; filled in later by consumers
+_EMPTY_PATH = Path("")
+
+# Base type name → resolution factory for types that never need a module lookup
+_WELLKNOWN_TYPES: Dict[str, Callable[[str], TypeResolution]] = {
+    **dict.fromkeys(_TYPING_TYPES, _typing_type_resolution),
+    **dict.fromkeys(_BUILTIN_TYPES, _builtin_type_resolution),
+}
+
+# Role bits for collected event usages
+_EVENT_PUBLISHER = 1
+_EVENT_SUBSCRIBER = 2
+
+# (event type, pattern name, role bits, element ref)
+RawEvent = Tuple[str, str, int, ElementRef]
+
+@dataclass
+class _ModuleResolutions:
+    """Import, type and call resolutions produced for a single module."""
+    import_resolutions: List[ImportResolution] = field(default_factory=list)
+    unresolved_imports: List[str] = field(default_factory=list)
+    import_dependencies: List[DependencySpec] = field(default_factory=list)
+    type_resolutions: Dict[str, TypeResolution] = field(default_factory=dict)
+    inheritance_dependencies: List[DependencySpec] = field(default_factory=list)
+    call_resolutions: List[CallResolution] = field(default_factory=list)
+
 
 class IndexBuilder:
     """
@@ -27,19 +82,32 @@ class IndexBuilder:
     between code elements to enable proper cross-references.
     """
     
+    __slots__ = (
+        'index',
+        '_module_map',
+        '_element_index',
+        '_method_index',
+        '_class_defining_modules',
+        '_function_defining_modules',
+        '_call_resolution_cache',
+        '_type_resolution_cache',
+        '_relative_import_cache',
+        '_event_context_cache',
+    )
+    
     def __init__(self):
         self.index = CrossReferenceIndex()
         self._module_map: Dict[str, Module] = {}
-        self._builtin_types = {
-            'int', 'str', 'bool', 'float', 'list', 'dict', 'tuple', 'set', 'frozenset',
-            'bytes', 'bytearray', 'memoryview', 'complex', 'object', 'type', 'None'
-        }
-        self._typing_types = {
-            'List', 'Dict', 'Tuple', 'Set', 'FrozenSet', 'Optional', 'Union', 'Any',
-            'Callable', 'Iterable', 'Iterator', 'Generator', 'Coroutine', 'Awaitable',
-            'AsyncIterable', 'AsyncIterator', 'AsyncGenerator', 'Type', 'TypeVar',
-            'Generic', 'Protocol', 'Literal', 'Final', 'ClassVar'
-        }
+        # Per-module lookups are keyed by file path: module names are file
+        # stems and collide across packages (__init__, handlers, ...)
+        self._element_index: Dict[Path, Dict[str, ElementRef]] = {}
+        self._method_index: Dict[Path, Dict[Tuple[str, str], ElementRef]] = {}
+        self._class_defining_modules: Dict[str, List[Path]] = defaultdict(list)
+        self._function_defining_modules: Dict[str, List[Path]] = defaultdict(list)
+        self._call_resolution_cache: Dict[Tuple[Tuple[str, ...], Path], CallResolution] = {}
+        self._type_resolution_cache: Dict[Tuple[str, Path], TypeResolution] = {}
+        self._relative_import_cache: Dict[Tuple[Optional[str], Optional[str], int], Optional[str]] = {}
+        self._event_context_cache: Dict[Tuple[str, str], Tuple[str, str]] = {}
     
     async def build_index(self, modules: List[Module]) -> CrossReferenceIndex:
         """
@@ -51,57 +119,116 @@ class IndexBuilder:
         Returns:
             Complete cross-reference index
         """
-        logger.info(f"Building cross-reference index for {len(modules)} modules")
+        logger.info("Building cross-reference index for %d modules", len(modules))
         
         # Store modules for reference resolution
         self._module_map = {module.name: module for module in modules}
+        self._type_resolution_cache = {}
+        self._call_resolution_cache = {}
         
         # Phase 1: Register all elements
         for module in modules:
             self.index.register_module(module)
+        self._build_element_index(modules)
         
-        # Phase 2: Resolve imports
-        await self._resolve_imports(modules)
-        
-        # Phase 3: Resolve type references
-        await self._resolve_type_references(modules)
+        # Phase 2: Resolve imports, type references and calls
+        resolved = await self._resolve_modules(modules)
         
-        # Phase 4: Resolve function/method calls
-        await self._resolve_call_references(modules)
+        # Phase 3: Record resolutions and extract event flows
+        await self._record_resolutions(modules, resolved)
         
-        # Phase 5: Build dependency graph
+        # Phase 4: Build dependency graph
         await self._build_dependency_graph(modules)
         
-        # Phase 6: Extract event flows
-        await self._extract_event_flows(modules)
-        
-        logger.info(f"Index built: {len(self.index.functions)} functions, "
-                   f"{len(self.index.classes)} classes, "
-                   f"{len(self.index.module_dependencies)} dependencies")
+        logger.info("Index built: %d functions, %d classes, %d dependencies",
+                    len(self.index.functions), len(self.index.classes),
+                    len(self.index.module_dependencies))
         
         return self.index
     
-    async def _resolve_imports(self, modules: List[Module]) -> None:
-        """Resolve import statements to their target elements."""
-        logger.debug("Resolving import statements...")
+    async def _resolve_modules(self, modules: List[Module]) -> List[_ModuleResolutions]:
+        """Resolve the imports, type references and calls of every module."""
+        return [self._resolve_module(module) for module in modules]
+    
+    def _resolve_module(self, module: Module) -> _ModuleResolutions:
+        """Resolve the imports, type references and calls of a single module."""
+        resolutions = _ModuleResolutions()
+        
+        add_dependencies = resolutions.import_dependencies.extend
+        add_resolution = resolutions.import_resolutions.append
+        add_unresolved = resolutions.unresolved_imports.append
+        for import_stmt in module.imports:
+            resolution, import_dependencies = self._resolve_single_import(import_stmt, module)
+            add_dependencies(import_dependencies)
+            if resolution:
+                add_resolution(resolution)
+            else:
+                # Track unresolved imports
+                add_unresolved(import_stmt.module or ', '.join(name for name, _ in import_stmt.names))
         
-        for module in modules:
-            for import_stmt in module.imports:
-                resolution = await self._resolve_single_import(import_stmt, module)
-                if resolution:
-                    self.index.import_resolutions.append(resolution)
-                else:
-                    # Track unresolved imports
-                    import_name = import_stmt.module or ', '.join([name for name, _ in import_stmt.names])
-                    self.index.unresolved_imports.append(import_name)
+        # Functions, including methods and nested functions
+        for func in module.get_all_functions():
+            self._resolve_function_types(func, module, resolutions)
+            self._resolve_function_calls(func, module, resolutions)
+        
+        for cls in module.classes:
+            self._resolve_class_types(cls, module, resolutions)
+        
+        return resolutions
     
-    async def _resolve_single_import(
+    async def _record_resolutions(
+        self, 
+        modules: List[Module], 
+        resolved: List[_ModuleResolutions]
+    ) -> None:
+        """Record module resolutions in the index and extract event flows."""
+        # Import results for every module land before any type or call results
+        for resolutions in resolved:
+            self.index.import_resolutions.extend(resolutions.import_resolutions)
+            self.index.unresolved_imports.extend(resolutions.unresolved_imports)
+            self.index.add_dependencies(resolutions.import_dependencies)
+        
+        raw_events: List[RawEvent] = []
+        
+        for module, resolutions in zip(modules, resolved):
+            self.index.type_resolutions.update(resolutions.type_resolutions)
+            self.index.add_dependencies(resolutions.inheritance_dependencies)
+            self.index.call_resolutions.extend(resolutions.call_resolutions)
+            
+            # Module-level events
+            for event in module.event_usage:
+                self._collect_event_usage(event, module.name, "", raw_events)
+            
+            # Class and method events
+            for cls in module.classes:
+                for event in cls.event_usage:
+                    self._collect_event_usage(event, module.name, cls.name, raw_events)
+                
+                for method in cls.methods:
+                    for event in method.event_usage:
+                        self._collect_event_usage(event, module.name, f"{cls.name}.{method.name}", raw_events)
+            
+            # Function events
+            for func in module.functions:
+                for event in func.event_usage:
+                    self._collect_event_usage(event, module.name, func.name, raw_events)
+        
+        self.index.event_flows = self._build_event_flows(raw_events)
+    
+    def _resolve_single_import(
         self, 
         import_stmt: ImportStatement, 
         from_module: Module
-    ) -> Optional[ImportResolution]:
-        """Resolve a single import statement."""
+    ) -> Tuple[Optional[ImportResolution], List[DependencySpec]]:
+        """
+        Resolve a single import statement.
+        
+        Returns the resolution (None if nothing resolved) and the module
+        dependencies it implies, leaving the index untouched.
+        """
         targets = []
+        dependencies: List[DependencySpec] = []
+        found_internal = False
         
         if import_stmt.module is None:
             # Direct imports: import os, sys
@@ -112,14 +239,15 @@ class IndexBuilder:
                         name=alias or name,
                         module=name,
                         element_type="module",
-                        anchor=f"module-{name}",
+                        anchor=sys.intern(f"module-{name}"),
                         file_path=self.index.module_paths[name]
                     )
                     targets.append(target)
+                    found_internal = True
                     
                     # Add dependency
-                    self.index.add_dependency(
-                        from_module.name, name, ReferenceType.IMPORT, f"import {name}"
+                    dependencies.append(
+                        (from_module.name, name, ReferenceType.IMPORT, f"import {name}")
                     )
         else:
             # From imports: from module import name
@@ -133,30 +261,31 @@ class IndexBuilder:
             
             if module_name and module_name in self._module_map:
                 target_module = self._module_map[module_name]
+                found_internal = True
                 
                 for name, alias in import_stmt.names:
                     target = self._find_element_in_module(name, target_module)
                     if target:
-                        # Update the name to use alias if provided
-                        target.name = alias or name
-                        targets.append(target)
+                        # Use the alias if provided, without touching the shared ref
+                        targets.append(replace(target, name=alias or name))
                 
                 # Add dependency
-                self.index.add_dependency(
+                dependencies.append((
                     from_module.name, module_name, ReferenceType.IMPORT, 
-                    f"from {import_stmt.module} import {', '.join([name for name, _ in import_stmt.names])}"
-                )
+                    f"from {import_stmt.module} import {', '.join(name for name, _ in import_stmt.names)}"
+                ))
         
         if targets:
-            return ImportResolution(
+            resolution = ImportResolution(
                 original_import=self._import_to_string(import_stmt),
                 resolved_module=import_stmt.module or "builtin",
                 imported_names=[alias or name for name, alias in import_stmt.names],
-                is_internal=any(target.module in self._module_map for target in targets),
+                is_internal=found_internal,
                 targets=targets
             )
+            return resolution, dependencies
         
-        return None
+        return None, dependencies
     
     def _resolve_relative_import(
         self, 
@@ -165,11 +294,26 @@ class IndexBuilder:
         from_module: Module
     ) -> Optional[str]:
         """Resolve relative import to absolute module name."""
-        if not from_module.package:
+        cache_key = (from_module.package, module_name, level)
+        if cache_key in self._relative_import_cache:
+            return self._relative_import_cache[cache_key]
+        
+        resolved = self._resolve_relative_import_uncached(module_name, level, from_module.package)
+        self._relative_import_cache[cache_key] = resolved
+        return resolved
+    
+    def _resolve_relative_import_uncached(
+        self, 
+        module_name: Optional[str], 
+        level: int, 
+        package: Optional[str]
+    ) -> Optional[str]:
+        """Resolve relative import without consulting the cache."""
+        if not package:
             return module_name
         
         # Split package into parts
-        package_parts = from_module.package.split('.')
+        package_parts = package.split('.')
         
         # Go up the specified number of levels
         if level > len(package_parts):
@@ -184,121 +328,140 @@ class IndexBuilder:
             # from .. import something
             return '.'.join(base_package_parts)
     
-    def _find_element_in_module(self, name: str, module: Module) -> Optional[ElementRef]:
-        """Find a named element within a module."""
-        # Check functions
-        for func in module.functions:
-            if func.name == name:
-                return ElementRef(
-                    name=name,
+    def _build_element_index(self, modules: List[Module]) -> None:
+        """Precompute per-module name → ElementRef lookups for element resolution."""
+        for module in modules:
+            elements: Dict[str, ElementRef] = {}
+            methods: Dict[Tuple[str, str], ElementRef] = {}
+            
+            # Earlier matches win, in the same order as a linear scan would find them
+            for func in module.functions:
+                elements.setdefault(func.name, ElementRef(
+                    name=func.name,
                     module=module.name,
                     element_type="function",
-                    anchor=func.get_anchor(),
+                    anchor=sys.intern(func.get_anchor()),
                     file_path=module.file_path,
                     location=func.location
-                )
-        
-        # Check classes
-        for cls in module.classes:
-            if cls.name == name:
-                return ElementRef(
-                    name=name,
+                ))
+            
+            for cls in module.classes:
+                elements.setdefault(cls.name, ElementRef(
+                    name=cls.name,
                     module=module.name,
                     element_type="class",
-                    anchor=cls.get_anchor(),
+                    anchor=sys.intern(cls.get_anchor()),
                     file_path=module.file_path,
                     location=cls.location
-                )
-            
-            # Check methods within classes
-            for method in cls.methods:
-                if method.name == name:
-                    return ElementRef(
-                        name=name,
+                ))
+                
+                for method in cls.methods:
+                    method_ref = ElementRef(
+                        name=method.name,
                         module=module.name,
                         element_type="method",
-                        anchor=method.get_anchor(),
+                        anchor=sys.intern(method.get_anchor()),
                         file_path=module.file_path,
                         location=method.location,
                         parent=cls.name
                     )
-        
-        # Check module-level attributes
-        for attr in module.attributes:
-            if attr.name == name:
-                return ElementRef(
-                    name=name,
+                    elements.setdefault(method.name, method_ref)
+                    methods.setdefault((cls.name, method.name), method_ref)
+            
+            for attr in module.attributes:
+                elements.setdefault(attr.name, ElementRef(
+                    name=attr.name,
                     module=module.name,
                     element_type="attribute",
-                    anchor=f"attribute-{name}",
+                    anchor=sys.intern(f"attribute-{attr.name}"),
                     file_path=module.file_path,
                     location=attr.location
-                )
-        
-        return None
-    
-    async def _resolve_type_references(self, modules: List[Module]) -> None:
-        """Resolve type annotations to their definitions."""
-        logger.debug("Resolving type references...")
-        
-        for module in modules:
-            # Resolve type references in functions
-            for func in module.get_all_functions():
-                await self._resolve_function_types(func, module)
+                ))
             
-            # Resolve type references in classes
-            for cls in module.classes:
-                await self._resolve_class_types(cls, module)
+            self._element_index[module.file_path] = elements
+            self._method_index[module.file_path] = methods
+        
+        # Invert to class/function name → files of the modules defining it,
+        # searched in module map order like the cross-module lookups
+        self._class_defining_modules = defaultdict(list)
+        self._function_defining_modules = defaultdict(list)
+        for module in self._module_map.values():
+            for name, ref in self._element_index[module.file_path].items():
+                if ref.element_type == "class":
+                    self._class_defining_modules[name].append(module.file_path)
+                elif ref.element_type in ("function", "method"):
+                    self._function_defining_modules[name].append(module.file_path)
     
-    async def _resolve_function_types(self, func: Function, module: Module) -> None:
+    def _find_element_in_module(self, name: str, module: Module) -> Optional[ElementRef]:
+        """Find a named element within a module."""
+        return self._element_index[module.file_path].get(name)
+    
+    def _resolve_function_types(
+        self, 
+        func: Function, 
+        module: Module, 
+        resolutions: _ModuleResolutions
+    ) -> None:
         """Resolve type references in a function."""
         # Resolve parameter types
         for param in func.parameters:
             if param.type_ref:
-                resolution = await self._resolve_type_name(param.type_ref.name, module)
+                resolution = self._resolve_type_name(param.type_ref.name, module)
                 if resolution:
-                    self.index.type_resolutions[f"{module.name}.{func.name}.{param.name}"] = resolution
+                    resolutions.type_resolutions[sys.intern(f"{module.name}.{func.name}.{param.name}")] = resolution
         
         # Resolve return type
         if func.return_type:
-            resolution = await self._resolve_type_name(func.return_type.name, module)
+            resolution = self._resolve_type_name(func.return_type.name, module)
             if resolution:
-                self.index.type_resolutions[f"{module.name}.{func.name}.return"] = resolution
+                resolutions.type_resolutions[sys.intern(f"{module.name}.{func.name}.return")] = resolution
     
-    async def _resolve_class_types(self, cls: Class, module: Module) -> None:
+    def _resolve_class_types(
+        self, 
+        cls: Class, 
+        module: Module, 
+        resolutions: _ModuleResolutions
+    ) -> None:
         """Resolve type references in a class."""
         # Resolve base classes
         for base_class in cls.base_classes:
-            resolution = await self._resolve_type_name(base_class, module)
+            resolution = self._resolve_type_name(base_class, module)
             if resolution:
-                self.index.type_resolutions[f"{module.name}.{cls.name}.base.{base_class}"] = resolution
+                resolutions.type_resolutions[sys.intern(f"{module.name}.{cls.name}.base.{base_class}")] = resolution
                 
                 # Add inheritance dependency
                 if resolution.resolved_to:
-                    self.index.add_dependency(
+                    resolutions.inheritance_dependencies.append((
                         module.name, resolution.resolved_to.module,
                         ReferenceType.INHERITANCE, f"{cls.name} inherits from {base_class}"
-                    )
+                    ))
         
         # Resolve attribute types
         for attr in cls.attributes:
             if attr.type_ref:
-                resolution = await self._resolve_type_name(attr.type_ref.name, module)
+                resolution = self._resolve_type_name(attr.type_ref.name, module)
                 if resolution:
-                    self.index.type_resolutions[f"{module.name}.{cls.name}.{attr.name}"] = resolution
+                    resolutions.type_resolutions[sys.intern(f"{module.name}.{cls.name}.{attr.name}")] = resolution
     
-    async def _resolve_type_name(self, type_name: str, context_module: Module) -> Optional[TypeResolution]:
+    def _resolve_type_name(self, type_name: str, context_module: Module) -> Optional[TypeResolution]:
         """Resolve a type name to its definition."""
+        cache_key = (type_name, context_module.file_path)
+        resolution = self._type_resolution_cache.get(cache_key)
+        if resolution is None:
+            resolution = self._type_resolution_cache[cache_key] = self._resolve_type_name_uncached(
+                type_name, context_module
+            )
+        return resolution
+    
+    def _resolve_type_name_uncached(self, type_name: str, context_module: Module) -> TypeResolution:
+        """Resolve a type name without consulting the resolution cache."""
         # Handle generic types like List[str]
-        base_type = type_name.split('[')[0] if '[' in type_name else type_name
+        base_type = type_name.partition('[')[0]
         
-        # Check if it's a builtin type
-        if base_type in self._builtin_types:
-            return TypeResolution(type_name=type_name, is_builtin=True)
-        
-        # Check if it's a typing module type
-        if base_type in self._typing_types:
-            return TypeResolution(type_name=type_name, is_external=True)
+        # Builtin and typing module types
+        wellknown = _WELLKNOWN_TYPES.get(base_type)
+        if wellknown is not None:
+            return wellknown(type_name)
         
         # Try to find in current module first
         element = self._find_element_in_module(base_type, context_module)
@@ -306,30 +469,45 @@ class IndexBuilder:
             return TypeResolution(type_name=type_name, resolved_to=element)
         
         # Try to find in other modules
-        for module_name, module in self._module_map.items():
-            element = self._find_element_in_module(base_type, module)
-            if element and element.element_type == "class":
-                return TypeResolution(type_name=type_name, resolved_to=element)
+        defining_modules = self._class_defining_modules.get(base_type)
+        if defining_modules:
+            return TypeResolution(
+                type_name=type_name,
+                resolved_to=self._element_index[defining_modules[0]][base_type]
+            )
         
         # Assume it's external if not found
         return TypeResolution(type_name=type_name, is_external=True)
     
-    async def _resolve_call_references(self, modules: List[Module]) -> None:
-        """Resolve function/method calls to their targets."""
-        logger.debug("Resolving call references...")
-        
-        for module in modules:
-            for func in module.get_all_functions():
-                for call in func.calls:
-                    resolution = await self._resolve_call(call.call_chain, module)
-                    if resolution:
-                        self.index.call_resolutions.append(resolution)
+    def _resolve_function_calls(
+        self, 
+        func: Function, 
+        module: Module, 
+        resolutions: _ModuleResolutions
+    ) -> None:
+        """Resolve the calls made by a function."""
+        resolve_call = self._resolve_call
+        add_resolution = resolutions.call_resolutions.append
+        for call in func.calls:
+            resolution = resolve_call(call.call_chain, module)
+            if resolution:
+                add_resolution(resolution)
     
-    async def _resolve_call(self, call_chain: List[str], context_module: Module) -> Optional[CallResolution]:
+    def _resolve_call(self, call_chain: List[str], context_module: Module) -> Optional[CallResolution]:
         """Resolve a function call to its target."""
         if not call_chain:
             return None
         
+        cache_key = (tuple(call_chain), context_module.file_path)
+        resolution = self._call_resolution_cache.get(cache_key)
+        if resolution is None:
+            resolution = self._call_resolution_cache[cache_key] = self._resolve_call_uncached(
+                call_chain, context_module
+            )
+        return resolution
+    
+    def _resolve_call_uncached(self, call_chain: List[str], context_module: Module) -> CallResolution:
+        """Resolve a non-empty call chain without consulting the resolution cache."""
         # Simple function call
         if len(call_chain) == 1:
             func_name = call_chain[0]
@@ -344,14 +522,13 @@ class IndexBuilder:
                 )
             
             # Try other modules
-            for module in self._module_map.values():
-                element = self._find_element_in_module(func_name, module)
-                if element and element.element_type in ("function", "method"):
-                    return CallResolution(
-                        call_chain=call_chain,
-                        resolved_to=element,
-                        confidence=0.8
-                    )
+            defining_modules = self._function_defining_modules.get(func_name)
+            if defining_modules:
+                return CallResolution(
+                    call_chain=call_chain,
+                    resolved_to=self._element_index[defining_modules[0]][func_name],
+                    confidence=0.8
+                )
         
         # Method call (obj.method)
         elif len(call_chain) >= 2:
@@ -359,23 +536,13 @@ class IndexBuilder:
             obj_name, method_name = call_chain[0], call_chain[1]
             
             # Look for class in current module
-            for cls in context_module.classes:
-                if cls.name == obj_name:
-                    for method in cls.methods:
-                        if method.name == method_name:
-                            return CallResolution(
-                                call_chain=call_chain,
-                                resolved_to=ElementRef(
-                                    name=method_name,
-                                    module=context_module.name,
-                                    element_type="method",
-                                    anchor=method.get_anchor(),
-                                    file_path=context_module.file_path,
-                                    location=method.location,
-                                    parent=cls.name
-                                ),
-                                confidence=0.9
-                            )
+            method_ref = self._method_index[context_module.file_path].get((obj_name, method_name))
+            if method_ref:
+                return CallResolution(
+                    call_chain=call_chain,
+                    resolved_to=method_ref,
+                    confidence=0.9
+                )
         
         # External or unresolved call
         return CallResolution(
@@ -386,8 +553,6 @@ class IndexBuilder:
     
     async def _build_dependency_graph(self, modules: List[Module]) -> None:
         """Build the module dependency graph."""
-        logger.debug("Building dependency graph...")
-        
         # Dependencies are already added during import resolution
         # Here we can add additional dependency types
         
@@ -395,86 +560,88 @@ class IndexBuilder:
             # Add inheritance dependencies
             for cls in module.classes:
                 for base_class in cls.base_classes:
-                    # Find which module defines this base class
-                    for other_module in self._module_map.values():
-                        if other_module.name != module.name:
-                            base_element = self._find_element_in_module(base_class, other_module)
-                            if base_element and base_element.element_type == "class":
-                                self.index.add_dependency(
-                                    module.name, other_module.name,
-                                    ReferenceType.INHERITANCE,
-                                    f"{cls.name} inherits from {base_class}"
-                                )
-                                break
-    
-    async def _extract_event_flows(self, modules: List[Module]) -> None:
-        """Extract event flow patterns from modules."""
-        logger.debug("Extracting event flows...")
-        
-        event_types: Dict[str, EventFlow] = {}
-        
-        for module in modules:
-            # Process module-level events
-            for event in module.event_usage:
-                self._add_event_to_flow(event, module.name, "", event_types)
-            
-            # Process class events
-            for cls in module.classes:
-                for event in cls.event_usage:
-                    self._add_event_to_flow(event, module.name, cls.name, event_types)
-                
-                # Process method events
-                for method in cls.methods:
-                    for event in method.event_usage:
-                        self._add_event_to_flow(event, module.name, f"{cls.name}.{method.name}", event_types)
-            
-            # Process function events
-            for func in module.functions:
-                for event in func.event_usage:
-                    self._add_event_to_flow(event, module.name, func.name, event_types)
-        
-        self.index.event_flows = event_types
+                    # Find which other module defines this base class
+                    defining_module = next(
+                        (ref.module for ref in (
+                            self._element_index[file_path][base_class]
+                            for file_path in self._class_defining_modules.get(base_class, ())
+                        ) if ref.module != module.name),
+                        None
+                    )
+                    if defining_module is None:
+                        continue
+                    
+                    # Skip edges already added while resolving base class types
+                    resolution = self._resolve_type_name(base_class, module)
+                    if resolution.resolved_to and resolution.resolved_to.module == defining_module:
+                        continue
+                    
+                    self.index.add_dependency(
+                        module.name, defining_module,
+                        ReferenceType.INHERITANCE,
+                        f"{cls.name} inherits from {base_class}"
+                    )
     
-    def _add_event_to_flow(
+    def _collect_event_usage(
         self, 
         event_usage, 
         module_name: str, 
         context: str,
-        event_types: Dict[str, EventFlow]
+        raw_events: List[RawEvent]
     ) -> None:
-        """Add an event usage to the flow tracking."""
-        event_type = event_usage.event_type
-        
-        if event_type not in event_types:
-            event_types[event_type] = EventFlow(
-                event_type=event_type,
-                pattern_name=event_usage.pattern_name
-            )
+        """Collect an event usage for flow tracking."""
+        context_key = (module_name, context)
+        context_info = self._event_context_cache.get(context_key)
+        if context_info is None:
+            if not context:
+                context_info = ("module", sys.intern(f"module-{module_name}"))
+            else:
+                context_info = ("method" if '.' in context else "function", sys.intern(f"function-{context}"))
+            self._event_context_cache[context_key] = context_info
+        element_type, anchor = context_info
         
         element_ref = ElementRef(
             name=context or module_name,
             module=module_name,
-            element_type="function" if context and '.' not in context else "method" if '.' in context else "module",
-            anchor=f"function-{context}" if context else f"module-{module_name}",
-            file_path=Path(""),  # Will be filled in later
+            element_type=element_type,
+            anchor=anchor,
+            file_path=_EMPTY_PATH,  # Will be filled in later
             location=event_usage.location
         )
         
-        if event_usage.is_publisher:
-            event_types[event_type].publishers.append(element_ref)
+        role = (_EVENT_PUBLISHER if event_usage.is_publisher else 0) | (
+            _EVENT_SUBSCRIBER if event_usage.is_subscriber else 0
+        )
+        raw_events.append((event_usage.event_type, event_usage.pattern_name, role, element_ref))
+    
+    def _build_event_flows(self, raw_events: List[RawEvent]) -> Dict[str, EventFlow]:
+        """Group collected event usages into flows by event type."""
+        event_types: Dict[str, EventFlow] = {}
+        
+        for event_type, pattern_name, role, element_ref in raw_events:
+            flow = event_types.get(event_type)
+            if flow is None:
+                flow = event_types[event_type] = EventFlow(
+                    event_type=event_type,
+                    pattern_name=pattern_name
+                )
+            
+            if role & _EVENT_PUBLISHER:
+                flow.publishers.append(element_ref)
+            if role & _EVENT_SUBSCRIBER:
+                flow.subscribers.append(element_ref)
         
-        if event_usage.is_subscriber:
-            event_types[event_type].subscribers.append(element_ref)
+        return event_types
     
     # Utility methods
     
     def _import_to_string(self, import_stmt: ImportStatement) -> str:
         """Convert import statement to string representation."""
         if import_stmt.module is None:
-            names = ', '.join([alias or name for name, alias in import_stmt.names])
+            names = ', '.join(alias or name for name, alias in import_stmt.names)
             return f"import {names}"
         else:
-            names = ', '.join([f"{name} as {alias}" if alias else name for name, alias in import_stmt.names])
+            names = ', '.join(f"{name} as {alias}" if alias else name for name, alias in import_stmt.names)
             return f"from {import_stmt.module} import {names}"
     
     def get_statistics(self) -> Dict[str, int]:
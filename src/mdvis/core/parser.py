@@ -6,13 +6,22 @@ type hints, async patterns, and other code elements.
 """
 
 import ast
+import hashlib
+import json
+import os
+import pickle
 import re
+import sys
+import zlib
 import asyncio
 import aiofiles
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple, Union
 import logging
 
+from ..utils.async_helpers import gather_with_limit
 from ..models.elements import (
     Module, Class, Function, Parameter, TypeRef, Location, Decorator,
     ImportStatement, CallRef, EventUsage, AsyncPattern, AsyncPatternType,
@@ -21,21 +30,275 @@ from ..models.elements import (
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever parsing changes what ends up in a Module or the cache entry
+# format changes, invalidating cached parses
+PARSER_SCHEMA_VERSION = 7
+
+# Locations share one placeholder path until a caller fills in the real one;
+# sharing it also lets pickle store it once per cached module
+_UNSET_PATH = Path("")
+
+_TODO_PATTERN = re.compile(r'#\s*(TODO|FIXME|XXX|HACK)\s*:?\s*(.*)', re.IGNORECASE)
+
+# Any TODO match contains one of these, so a single scan rules out most files
+_TODO_MARKER = re.compile(r'TODO|FIXME|XXX|HACK', re.IGNORECASE)
+
+# Backreferences and global inline flags change meaning once patterns are joined
+_UNSAFE_TO_COMBINE = re.compile(r'\\[1-9]|\(\?P=|\(\?[aiLmsux]+\)')
+
+
+def _combine_patterns(patterns: List[str]) -> List[re.Pattern]:
+    """
+    Compile patterns into a list whose searches match exactly when any of
+    the originals would: a single alternation when that is safe, otherwise
+    one regex per pattern.
+    """
+    compiled = [re.compile(p) for p in patterns]
+    if len(patterns) < 2 or any(_UNSAFE_TO_COMBINE.search(p) for p in patterns):
+        return compiled
+    
+    try:
+        return [re.compile('|'.join(f'(?:{p})' for p in patterns))]
+    except re.error:
+        return compiled
+
+
+def _skip_bracketed(pattern: str, i: int) -> int:
+    """Return the index just past the group or character class opening at i."""
+    depth = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '\\':
+            i += 2
+            continue
+        if c == '[':
+            # Character classes may contain unescaped brackets and parentheses
+            i += 1
+            if i < n and pattern[i] == '^':
+                i += 1
+            if i < n and pattern[i] == ']':
+                i += 1
+            while i < n and pattern[i] != ']':
+                i += 2 if pattern[i] == '\\' else 1
+            if depth == 0:
+                return i + 1
+        elif c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def _required_literal(pattern: str) -> Optional[str]:
+    """
+    Longest literal substring that every match of pattern must contain, or
+    None when no such literal can be determined safely.
+    """
+    if _UNSAFE_TO_COMBINE.search(pattern):
+        return None
+    
+    best = ''
+    run: List[str] = []
+    i = 0
+    n = len(pattern)
+    while i < n:
+        c = pattern[i]
+        literal = None
+        if c == '\\':
+            if i + 1 >= n:
+                return None
+            escaped = pattern[i + 1]
+            if not escaped.isalnum():
+                literal = escaped
+            elif escaped in 'xuUN01234567':
+                # Numeric and named escapes would need decoding; stay conservative
+                return None
+            i += 2
+        elif c in '[(':
+            i = _skip_bracketed(pattern, i)
+        elif c == '|':
+            # Top-level alternation: no single literal is required
+            return None
+        elif c in '*+?{})':
+            return None
+        else:
+            if c not in '.^$':
+                literal = c
+            i += 1
+        
+        # A quantified atom contributes at most one required copy, and only
+        # when it must occur at least once
+        if i < n and pattern[i] in '*+?{':
+            quantifier = pattern[i]
+            if quantifier == '{':
+                close = pattern.find('}', i)
+                if close < 0:
+                    return None
+                i = close + 1
+            else:
+                i += 1
+            if i < n and pattern[i] in '?+':
+                i += 1
+            if literal is not None and quantifier == '+':
+                run.append(literal)
+            literal = None
+        
+        if literal is None:
+            if len(run) > len(best):
+                best = ''.join(run)
+            run = []
+        else:
+            run.append(literal)
+    
+    if len(run) > len(best):
+        best = ''.join(run)
+    return best or None
+
+
+def _role_anchors(patterns: List[str]) -> Optional[Tuple[str, ...]]:
+    """
+    Required literals of a role's patterns: a call can only match the role
+    if it contains one of them. None when some pattern has no such literal.
+    """
+    anchors = []
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if literal is None:
+            return None
+        if literal not in anchors:
+            anchors.append(literal)
+    return tuple(anchors)
+
+
+def _event_prefilter(patterns: List[str]) -> Optional[re.Pattern]:
+    """
+    Build one literal scan that any event pattern match implies, so calls
+    mentioning none of the required literals skip every pattern regex.
+    Returns None when some pattern has no required literal.
+    """
+    literals = set()
+    for pattern in patterns:
+        literal = _required_literal(pattern)
+        if literal is None:
+            return None
+        literals.add(literal)
+    if not literals:
+        return None
+    return re.compile('|'.join(re.escape(literal) for literal in sorted(literals)))
+
+
+def _simple_expr_to_string(node: ast.AST) -> Optional[str]:
+    """
+    Render names, dotted names, plain literals and subscripts of those the
+    way ast.unparse would, without running the full unparser.
+    
+    Returns None for any other shape so callers can fall back to ast.unparse.
+    """
+    node_type = type(node)
+    
+    if node_type is ast.Name:
+        return node.id
+    
+    if node_type is ast.Attribute:
+        parts = []
+        while type(node) is ast.Attribute:
+            parts.append(node.attr)
+            node = node.value
+        if type(node) is not ast.Name:
+            return None
+        parts.append(node.id)
+        return '.'.join(reversed(parts))
+    
+    if node_type is ast.Constant:
+        value = node.value
+        if value is None or type(value) in (bool, int):
+            return repr(value)
+        if type(value) is str and node.kind is None:
+            # unparse avoids backslashes by switching quote styles; leave those to it
+            text = repr(value)
+            return text if '\\' not in text else None
+        return None
+    
+    if node_type is ast.Subscript:
+        value = _simple_expr_to_string(node.value)
+        if value is None:
+            return None
+        
+        slice_node = node.slice
+        if type(slice_node) is ast.Tuple:
+            if len(slice_node.elts) < 2:
+                return None
+            elts = [_simple_expr_to_string(elt) for elt in slice_node.elts]
+            if None in elts:
+                return None
+            return f"{value}[{', '.join(elts)}]"
+        
+        index = _simple_expr_to_string(slice_node)
+        return f"{value}[{index}]" if index is not None else None
+    
+    return None
+
 
 class EnhancedASTParser:
     """
     Enhanced AST parser that extracts detailed code structure and metadata.
     """
     
-    def __init__(self, event_patterns: Optional[List[dict]] = None):
+    def __init__(
+        self,
+        event_patterns: Optional[List[dict]] = None,
+        cache_dir: Optional[Path] = None,
+        keep_source: bool = True
+    ):
         """
         Initialize the parser.
         
         Args:
             event_patterns: List of event detection patterns
+            cache_dir: Directory for parsed modules reused across runs;
+                caching is disabled when None
+            keep_source: Keep each file's text on Module.source_code; when
+                False it is released once metrics and TODOs are extracted
         """
         self.event_patterns = event_patterns or []
         self._compiled_patterns = self._compile_event_patterns()
+        # One (name, is_publisher, anchors, role regexes, event type regex,
+        # call text fallback) row per pattern role, so the per-call loop
+        # needs no dict lookups
+        self._event_roles = [
+            (
+                config['name'],
+                is_publisher,
+                config[f'{role}_anchors'],
+                config[f'{role}_patterns'],
+                config['extract_event_type'],
+                config['extract_from_call_text']
+            )
+            for config in self._compiled_patterns
+            for role, is_publisher in (('publisher', True), ('subscriber', False))
+        ]
+        self._event_prefilter = _event_prefilter([
+            role_pattern
+            for pattern in self.event_patterns
+            for role_key in ('publisher_patterns', 'subscriber_patterns')
+            for role_pattern in pattern.get(role_key, ())
+        ])
+        self.cache_dir = cache_dir
+        self.keep_source = keep_source
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._package_cache: Dict[Path, Optional[str]] = {}
+        self._type_ref_cache: Dict[Tuple[type, str], Optional[TypeRef]] = {}
+        
+        # Everything besides the source that shapes a parsed module
+        self._cache_salt = json.dumps(
+            [PARSER_SCHEMA_VERSION, sys.version_info[:2], self.event_patterns],
+            sort_keys=True
+        ).encode('utf-8')
     
     def _compile_event_patterns(self) -> List[dict]:
         """Compile regex patterns for event detection."""
@@ -44,9 +307,12 @@ class EnhancedASTParser:
             try:
                 compiled_pattern = {
                     'name': pattern['name'],
-                    'publisher_patterns': [re.compile(p) for p in pattern['publisher_patterns']],
-                    'subscriber_patterns': [re.compile(p) for p in pattern['subscriber_patterns']],
-                    'extract_event_type': re.compile(pattern['extract_event_type'])
+                    'publisher_patterns': _combine_patterns(pattern['publisher_patterns']),
+                    'subscriber_patterns': _combine_patterns(pattern['subscriber_patterns']),
+                    'publisher_anchors': _role_anchors(pattern['publisher_patterns']),
+                    'subscriber_anchors': _role_anchors(pattern['subscriber_patterns']),
+                    'extract_event_type': re.compile(pattern['extract_event_type']),
+                    'extract_from_call_text': pattern.get('extract_from_call_text', True)
                 }
                 compiled.append(compiled_pattern)
             except re.error as e:
@@ -66,12 +332,33 @@ class EnhancedASTParser:
         """
         if source_code is None:
             try:
-                async with aiofiles.open(file_path, 'r', encoding='utf-8') as f:
-                    source_code = await f.read()
+                # One blocking read in the default executor is cheaper than
+                # aiofiles' chunked, thread-hopping text reads for source files
+                loop = asyncio.get_running_loop()
+                data = await loop.run_in_executor(None, file_path.read_bytes)
+                source_code = data.decode('utf-8')
+                if '\r' in source_code:
+                    # Match text-mode universal newline handling
+                    source_code = source_code.replace('\r\n', '\n').replace('\r', '\n')
             except Exception as e:
                 logger.error(f"Error reading file {file_path}: {e}")
                 raise
         
+        cache_path = None
+        if self.cache_dir is not None:
+            cache_path = self._cache_path(source_code)
+            module = await self._load_cached_module(cache_path)
+            if module is not None:
+                self.cache_hits += 1
+                # Cached entries are path-independent; rebind them to this file
+                module.name = sys.intern(file_path.stem)
+                module.file_path = file_path
+                module.package = self._determine_package(file_path)
+                if self.keep_source:
+                    module.source_code = source_code
+                return module
+            self.cache_misses += 1
+        
         try:
             # Parse the AST
             tree = ast.parse(source_code, filename=str(file_path))
@@ -81,9 +368,9 @@ class EnhancedASTParser:
         
         # Create the module object
         module = Module(
-            name=file_path.stem,
+            name=sys.intern(file_path.stem),
             file_path=file_path,
-            source_code=source_code,
+            source_code=source_code if self.keep_source else None,
             docstring=ast.get_docstring(tree)
         )
         
@@ -93,32 +380,162 @@ class EnhancedASTParser:
         # Parse the module contents
         self._parse_module_body(tree, module, source_code)
         
-        # Extract metrics
-        module.lines_of_code = len(source_code.splitlines())
-        module.lines_blank = len([line for line in source_code.splitlines() if not line.strip()])
-        module.lines_of_comments = self._count_comment_lines(source_code)
-        
-        # Extract TODOs
-        module.todos = self._extract_todos(source_code)
+        # Extract metrics and TODOs
+        (
+            module.lines_of_code,
+            module.lines_blank,
+            module.lines_of_comments,
+            module.todos
+        ) = self._scan_source_lines(source_code)
         
         logger.debug(f"Parsed module {module.name}: {len(module.classes)} classes, {len(module.functions)} functions")
         
+        if cache_path is not None:
+            await self._store_cached_module(cache_path, module)
+        
         return module
     
+    async def parse_files(
+        self, 
+        file_paths: List[Path], 
+        max_concurrent: Optional[int] = None,
+        return_exceptions: bool = False,
+        workers: int = 1
+    ) -> List[Union[Module, Exception]]:
+        """
+        Parse many files concurrently.
+        
+        Reads for some files overlap with parsing of others, with at most
+        max_concurrent files in flight. Parsing itself is CPU-bound, so with
+        workers > 1 the files are split into batches parsed in that many
+        worker processes.
+        
+        Args:
+            file_paths: Paths of the Python files to parse
+            max_concurrent: Concurrency limit (defaults to the CPU count)
+            return_exceptions: Return per-file exceptions instead of raising
+            workers: Number of worker processes; 1 parses in this process
+            
+        Returns:
+            Parsed modules (or exceptions) in the same order as file_paths
+        """
+        if workers > 1 and len(file_paths) > 1:
+            return await self._parse_files_in_processes(file_paths, workers, return_exceptions)
+        
+        return await gather_with_limit(
+            *(self.parse_file(file_path) for file_path in file_paths),
+            limit=max_concurrent or os.cpu_count() or 8,
+            return_exceptions=return_exceptions
+        )
+    
+    async def _parse_files_in_processes(
+        self,
+        file_paths: List[Path],
+        workers: int,
+        return_exceptions: bool
+    ) -> List[Union[Module, Exception]]:
+        """Parse files in batches across a pool of worker processes."""
+        # A few batches per worker keeps the pool busy without paying
+        # per-file task overhead
+        batch_size = -(-len(file_paths) // (workers * 4))
+        batches = [file_paths[i:i + batch_size] for i in range(0, len(file_paths), batch_size)]
+        
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_parse_worker,
+            initargs=(self.event_patterns, self.cache_dir, self.keep_source)
+        ) as pool:
+            # A dead worker or an unpicklable result fails only its own batch
+            batch_results = await asyncio.gather(
+                *(loop.run_in_executor(pool, _parse_batch, batch) for batch in batches),
+                return_exceptions=True
+            )
+        
+        results: List[Union[Module, Exception]] = []
+        for batch, batch_result in zip(batches, batch_results):
+            if isinstance(batch_result, Exception):
+                # Every file in the failed batch counts as failed
+                results.extend([batch_result] * len(batch))
+                continue
+            if isinstance(batch_result, BaseException):
+                raise batch_result
+            
+            batch_modules, hits, misses = batch_result
+            results.extend(batch_modules)
+            self.cache_hits += hits
+            self.cache_misses += misses
+        
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+        return results
+    
+    def _cache_path(self, source_code: str) -> Path:
+        """Cache file for a parse of the given source."""
+        digest = hashlib.sha256(source_code.encode('utf-8'))
+        digest.update(self._cache_salt)
+        key = digest.hexdigest()
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+    
+    async def _load_cached_module(self, cache_path: Path) -> Optional[Module]:
+        """Load a cached parse, or None on a miss or unreadable entry."""
+        try:
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(None, cache_path.read_bytes)
+            module = pickle.loads(zlib.decompress(payload))
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            # Stale or corrupt entries (e.g. records whose constructor
+            # arguments changed) are misses, never parse failures
+            logger.debug(f"Ignoring unreadable parse cache entry {cache_path}: {e}")
+            return None
+        
+        return module if isinstance(module, Module) else None
+    
+    async def _store_cached_module(self, cache_path: Path, module: Module) -> None:
+        """Write a parsed module to the cache, atomically replacing any entry."""
+        # The source is the cache key and the path fields are rebound on load,
+        # so neither is stored; fast compression keeps the pickled tree small
+        payload = zlib.compress(
+            pickle.dumps(
+                replace(module, file_path=_UNSET_PATH, package=None, source_code=None),
+                protocol=pickle.HIGHEST_PROTOCOL
+            ),
+            1
+        )
+        # Identical sources share an entry and may be written concurrently
+        temp_path = cache_path.with_suffix(f".{os.getpid()}-{id(module)}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            async with aiofiles.open(temp_path, 'wb') as f:
+                await f.write(payload)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            logger.debug(f"Could not write parse cache entry {cache_path}: {e}")
+            temp_path.unlink(missing_ok=True)
+    
     def _determine_package(self, file_path: Path) -> Optional[str]:
         """Determine the package name for a file based on its path."""
-        # Look for __init__.py files to determine package structure
-        current_dir = file_path.parent
-        package_parts = []
-        
-        while current_dir != current_dir.parent:  # Stop at filesystem root
-            if (current_dir / '__init__.py').exists():
-                package_parts.insert(0, current_dir.name)
-                current_dir = current_dir.parent
-            else:
-                break
+        return self._directory_package(file_path.parent)
+    
+    def _directory_package(self, directory: Path) -> Optional[str]:
+        """Package a directory belongs to, memoized per directory."""
+        if directory in self._package_cache:
+            return self._package_cache[directory]
+        
+        # Look for __init__.py files to determine package structure,
+        # stopping at the filesystem root
+        if directory == directory.parent or not (directory / '__init__.py').exists():
+            package = None
+        else:
+            parent_package = self._directory_package(directory.parent)
+            package = sys.intern(f"{parent_package}.{directory.name}" if parent_package else directory.name)
         
-        return '.'.join(package_parts) if package_parts else None
+        self._package_cache[directory] = package
+        return package
     
     def _parse_module_body(self, tree: ast.AST, module: Module, source_code: str) -> None:
         """Parse the body of a module."""
@@ -142,12 +559,13 @@ class EnhancedASTParser:
     
     def _parse_class(self, node: ast.ClassDef, source_code: str, parent_name: str = "") -> Class:
         """Parse a class definition."""
+        # Positional arguments: file path (set by caller), lines, columns
         location = Location(
-            file_path=Path(""),  # Will be set by caller
-            line_start=node.lineno,
-            line_end=getattr(node, 'end_lineno', node.lineno),
-            column_start=node.col_offset,
-            column_end=getattr(node, 'end_col_offset', 0)
+            _UNSET_PATH,
+            node.lineno,
+            node.end_lineno or node.lineno,
+            node.col_offset,
+            node.end_col_offset or 0
         )
         
         cls = Class(
@@ -163,7 +581,7 @@ class EnhancedASTParser:
         cls.decorators = self._parse_decorators(node.decorator_list)
         
         # Check for special class types
-        cls.is_dataclass = any(self._decorator_name(dec) == 'dataclass' for dec in cls.decorators)
+        cls.is_dataclass = any(dec.name == 'dataclass' for dec in cls.decorators)
         cls.is_abstract = any('ABC' in base or 'Abstract' in base for base in cls.base_classes)
         cls.is_exception = any('Exception' in base or 'Error' in base for base in cls.base_classes)
         
@@ -188,10 +606,12 @@ class EnhancedASTParser:
         cls.public_method_count = len([m for m in cls.methods if m.visibility == VisibilityLevel.PUBLIC])
         cls.lines_of_code = location.line_end - location.line_start + 1
         
-        # Extract type references and async patterns
-        cls.type_references = self._extract_type_references_from_node(node)
-        cls.async_patterns = self._extract_async_patterns_from_node(node)
-        cls.event_usage = self._extract_event_usage_from_node(node, source_code)
+        # Extract type references, async patterns and events in one walk
+        analysis = _BodyVisitor(self)
+        analysis.visit(node)
+        cls.type_references = analysis.type_references
+        cls.async_patterns = analysis.async_patterns
+        cls.event_usage = analysis.event_usage
         
         return cls
     
@@ -203,12 +623,13 @@ class EnhancedASTParser:
         parent_function: Optional[Function] = None
     ) -> Function:
         """Parse a function or method definition."""
+        # Positional arguments: file path (set by caller), lines, columns
         location = Location(
-            file_path=Path(""),  # Will be set by caller
-            line_start=node.lineno,
-            line_end=getattr(node, 'end_lineno', node.lineno),
-            column_start=node.col_offset,
-            column_end=getattr(node, 'end_col_offset', 0)
+            _UNSET_PATH,
+            node.lineno,
+            node.end_lineno or node.lineno,
+            node.col_offset,
+            node.end_col_offset or 0
         )
         
         # Parse parameters
@@ -234,25 +655,26 @@ class EnhancedASTParser:
         
         # Determine function type and visibility
         func.visibility = self._determine_visibility(node.name)
-        func.is_property = any(self._decorator_name(dec) == 'property' for dec in func.decorators)
-        func.is_static_method = any(self._decorator_name(dec) == 'staticmethod' for dec in func.decorators)
-        func.is_class_method = any(self._decorator_name(dec) == 'classmethod' for dec in func.decorators)
-        func.is_abstract = any('abstract' in self._decorator_name(dec).lower() for dec in func.decorators)
-        
-        # Check if it's a generator
-        func.is_generator = self._has_yield(node)
+        decorator_names = {dec.name for dec in func.decorators}
+        func.is_property = 'property' in decorator_names
+        func.is_static_method = 'staticmethod' in decorator_names
+        func.is_class_method = 'classmethod' in decorator_names
+        func.is_abstract = any('abstract' in name.lower() for name in decorator_names)
+        
+        # Walk the body once for calls, generator status, analysis data and complexity
+        analysis = _BodyVisitor(self)
+        analysis.visit(node)
+        func.is_generator = analysis.has_yield
+        func.calls = analysis.calls
+        func.type_references = analysis.type_references
+        func.async_patterns = analysis.async_patterns
+        func.event_usage = analysis.event_usage
         
         # Parse function body
-        func.calls = self._extract_function_calls(node)
         func.nested_functions = self._extract_nested_functions(node, source_code, func)
         
-        # Extract analysis data
-        func.type_references = self._extract_type_references_from_node(node)
-        func.async_patterns = self._extract_async_patterns_from_node(node)
-        func.event_usage = self._extract_event_usage_from_node(node, source_code)
-        
         # Calculate metrics
-        func.complexity = self._calculate_complexity(node)
+        func.complexity = analysis.complexity
         func.lines_of_code = location.line_end - location.line_start + 1
         
         return func
@@ -261,19 +683,25 @@ class EnhancedASTParser:
         """Parse function parameters."""
         parameters = []
         
-        # Regular arguments
-        for i, arg in enumerate(args.args):
-            default_value = None
-            if args.defaults and i >= len(args.args) - len(args.defaults):
-                default_idx = i - (len(args.args) - len(args.defaults))
-                default_value = self._ast_to_string(args.defaults[default_idx])
-            
-            param = Parameter(
+        # Regular arguments; defaults belong to the trailing ones
+        positional = args.args
+        defaults = args.defaults
+        first_default = len(positional) - len(defaults)
+        split = max(first_default, 0)
+        
+        for arg in positional[:split]:
+            parameters.append(Parameter(
+                name=arg.arg,
+                type_ref=self._parse_type_annotation(arg.annotation) if arg.annotation else None
+            ))
+        
+        for i in range(split, len(positional)):
+            arg = positional[i]
+            parameters.append(Parameter(
                 name=arg.arg,
                 type_ref=self._parse_type_annotation(arg.annotation) if arg.annotation else None,
-                default_value=default_value
-            )
-            parameters.append(param)
+                default_value=self._ast_to_string(defaults[i - first_default])
+            ))
         
         # *args parameter
         if args.vararg:
@@ -284,19 +712,14 @@ class EnhancedASTParser:
             )
             parameters.append(param)
         
-        # Keyword-only arguments
-        for i, arg in enumerate(args.kwonlyargs):
-            default_value = None
-            if args.kw_defaults and i < len(args.kw_defaults) and args.kw_defaults[i]:
-                default_value = self._ast_to_string(args.kw_defaults[i])
-            
-            param = Parameter(
+        # Keyword-only arguments (kw_defaults is parallel, with None for no default)
+        for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+            parameters.append(Parameter(
                 name=arg.arg,
                 type_ref=self._parse_type_annotation(arg.annotation) if arg.annotation else None,
-                default_value=default_value,
+                default_value=self._ast_to_string(default) if default else None,
                 is_keyword_only=True
-            )
-            parameters.append(param)
+            ))
         
         # **kwargs parameter
         if args.kwarg:
@@ -314,9 +737,18 @@ class EnhancedASTParser:
         if not annotation:
             return None
         
+        # TypeRefs are never modified after parsing, so identical annotations share one
+        type_str = self._ast_to_string(annotation)
+        cache_key = (type(annotation), type_str)
+        if cache_key in self._type_ref_cache:
+            return self._type_ref_cache[cache_key]
+        
+        type_ref = self._type_ref_cache[cache_key] = self._build_type_ref(annotation, type_str)
+        return type_ref
+    
+    def _build_type_ref(self, annotation: ast.AST, type_str: str) -> Optional[TypeRef]:
+        """Build the TypeRef for an annotation rendered as type_str."""
         try:
-            type_str = self._ast_to_string(annotation)
-            
             # Handle common type patterns
             if isinstance(annotation, ast.Name):
                 return TypeRef(
@@ -425,49 +857,26 @@ class EnhancedASTParser:
                 type_ref=type_ref,
                 default_value=default_value,
                 is_class_var=is_class_var,
-                location=Location(
-                    file_path=Path(""),  # Will be set by caller
-                    line_start=node.lineno,
-                    line_end=getattr(node, 'end_lineno', node.lineno)
-                ),
+                location=Location(_UNSET_PATH, node.lineno, node.end_lineno or node.lineno),
                 visibility=self._determine_visibility(name)
             )
         except Exception as e:
             logger.debug(f"Error parsing attribute {name}: {e}")
             return None
     
-    def _extract_function_calls(self, node: ast.FunctionDef) -> List[CallRef]:
-        """Extract function calls from a function body."""
-        calls = []
-        
-        parser = self
-        
-        class CallVisitor(ast.NodeVisitor):
-            def visit_Call(self, call_node: ast.Call):
-                call_chain = parser._extract_call_chain(call_node.func)
-                if call_chain:
-                    calls.append(CallRef(
-                        call_chain=call_chain,
-                        is_async=isinstance(call_node.func, ast.Attribute) and 
-                                call_node.func.attr in {'create_task', 'gather', 'wait_for'}
-                    ))
-                self.generic_visit(call_node)
-        
-        visitor = CallVisitor()
-        visitor.visit(node)
-        
-        return calls
-
-    
     def _extract_call_chain(self, node: ast.AST) -> List[str]:
         """Extract call chain from an AST node (e.g., obj.method.call -> ['obj', 'method', 'call'])."""
         if isinstance(node, ast.Name):
             return [node.id]
-        elif isinstance(node, ast.Attribute):
-            base_chain = self._extract_call_chain(node.value)
-            if base_chain:
-                return base_chain + [node.attr]
-        return []
+        chain = []
+        while isinstance(node, ast.Attribute):
+            chain.append(node.attr)
+            node = node.value
+        if not isinstance(node, ast.Name):
+            return []
+        chain.append(node.id)
+        chain.reverse()
+        return chain
     
     def _extract_nested_functions(
         self, 
@@ -536,66 +945,15 @@ class EnhancedASTParser:
     
     def _ast_to_string(self, node: ast.AST) -> str:
         """Convert AST node to string representation."""
+        text = _simple_expr_to_string(node)
+        if text is not None:
+            return text
+        
         try:
-            if hasattr(ast, 'unparse'):  # Python 3.9+
-                return ast.unparse(node)
-            else:
-                # Fallback for older Python versions
-                import astor
-                return astor.to_source(node).strip()
+            return ast.unparse(node)
         except Exception:
             return str(type(node).__name__)
     
-    def _has_yield(self, node: ast.FunctionDef) -> bool:
-        """Check if function contains yield statements."""
-        class YieldVisitor(ast.NodeVisitor):
-            def __init__(self):
-                self.has_yield = False
-            
-            def visit_Yield(self, node):
-                self.has_yield = True
-            
-            def visit_YieldFrom(self, node):
-                self.has_yield = True
-        
-        visitor = YieldVisitor()
-        visitor.visit(node)
-        return visitor.has_yield
-    
-    def _calculate_complexity(self, node: ast.FunctionDef) -> int:
-        """Calculate cyclomatic complexity of a function."""
-        complexity = 1  # Base complexity
-        
-        class ComplexityVisitor(ast.NodeVisitor):
-            def visit_If(self, node):
-                nonlocal complexity
-                complexity += 1
-                self.generic_visit(node)
-            
-            def visit_For(self, node):
-                nonlocal complexity
-                complexity += 1
-                self.generic_visit(node)
-            
-            def visit_While(self, node):
-                nonlocal complexity
-                complexity += 1
-                self.generic_visit(node)
-            
-            def visit_Try(self, node):
-                nonlocal complexity
-                complexity += len(node.handlers)
-                self.generic_visit(node)
-            
-            def visit_With(self, node):
-                nonlocal complexity
-                complexity += 1
-                self.generic_visit(node)
-        
-        visitor = ComplexityVisitor()
-        visitor.visit(node)
-        return complexity
-    
     def _extract_base_classes(self, node: ast.ClassDef) -> List[str]:
         """Extract base class names."""
         base_classes = []
@@ -607,211 +965,40 @@ class EnhancedASTParser:
         return base_classes
     
     
-    def _extract_type_references_from_node(self, node: ast.AST) -> List[TypeRef]:
-        """Extract all type references from an AST node."""
-        type_refs = []
-        
-        parser = self
-        
-        class TypeVisitor(ast.NodeVisitor):
-            def visit_arg(self, node):
-                if node.annotation:
-                    type_ref = parser._parse_type_annotation(node.annotation)
-                    if type_ref:
-                        type_refs.append(type_ref)
-                self.generic_visit(node)
-            
-            def visit_FunctionDef(self, node):
-                # Return type annotation
-                if node.returns:
-                    type_ref = parser._parse_type_annotation(node.returns)
-                    if type_ref:
-                        type_refs.append(type_ref)
-                self.generic_visit(node)
-            
-            def visit_AnnAssign(self, node):
-                # Variable type annotations
-                if node.annotation:
-                    type_ref = parser._parse_type_annotation(node.annotation)
-                    if type_ref:
-                        type_refs.append(type_ref)
-                self.generic_visit(node)
-        
-        visitor = TypeVisitor()
-        visitor.visit(node)
-        return type_refs
-    
-    def _extract_async_patterns_from_node(self, node: ast.AST) -> List[AsyncPattern]:
-        """Extract async patterns from an AST node."""
-        patterns = []
-        
-        parser = self
-        
-        class AsyncVisitor(ast.NodeVisitor):
-            def visit_AsyncFunctionDef(self, func_node):
-                location = Location(
-                    file_path=Path(""),
-                    line_start=func_node.lineno,
-                    line_end=getattr(func_node, 'end_lineno', func_node.lineno)
-                )
-                
-                # Check for factory method pattern
-                is_factory = (
-                    any(parser._decorator_name(dec) == 'classmethod' for dec in func_node.decorator_list) and
-                    func_node.name in ('create', 'from_config', 'build', 'make')
-                )
-                
-                if is_factory:
-                    patterns.append(AsyncPattern(
-                        pattern_type=AsyncPatternType.FACTORY_METHOD,
-                        location=location,
-                        details={'method_name': func_node.name}
-                    ))
-                else:
-                    pattern_type = AsyncPatternType.ASYNC_METHOD if hasattr(node, 'name') else AsyncPatternType.ASYNC_FUNCTION
-                    patterns.append(AsyncPattern(
-                        pattern_type=pattern_type,
-                        location=location,
-                        details={'function_name': func_node.name}
-                    ))
-                
-                self.generic_visit(func_node)
-            
-            def visit_AsyncWith(self, with_node):
-                location = Location(
-                    file_path=Path(""),
-                    line_start=with_node.lineno,
-                    line_end=getattr(with_node, 'end_lineno', with_node.lineno)
-                )
-                
-                context_managers = []
-                for item in with_node.items:
-                    context_managers.append(parser._ast_to_string(item.context_expr))
-                
-                patterns.append(AsyncPattern(
-                    pattern_type=AsyncPatternType.ASYNC_CONTEXT_MANAGER,
-                    location=location,
-                    details={'context_managers': context_managers}
-                ))
-                self.generic_visit(with_node)
-            
-            def visit_Call(self, call_node):
-                call_chain = parser._extract_call_chain(call_node.func)
-                
-                # Check for asyncio task creation patterns
-                if call_chain:
-                    func_name = call_chain[-1]
-                    if func_name in ('create_task', 'ensure_future'):
-                        location = Location(
-                            file_path=Path(""),
-                            line_start=call_node.lineno,
-                            line_end=getattr(call_node, 'end_lineno', call_node.lineno)
-                        )
-                        patterns.append(AsyncPattern(
-                            pattern_type=AsyncPatternType.CREATE_TASK,
-                            location=location,
-                            details={'call_chain': call_chain, 'function': func_name}
-                        ))
-                    elif func_name == 'gather':
-                        location = Location(
-                            file_path=Path(""),
-                            line_start=call_node.lineno,
-                            line_end=getattr(call_node, 'end_lineno', call_node.lineno)
-                        )
-                        patterns.append(AsyncPattern(
-                            pattern_type=AsyncPatternType.GATHER,
-                            location=location,
-                            details={'call_chain': call_chain, 'arg_count': len(call_node.args)}
-                        ))
-                
-                self.generic_visit(call_node)
-        
-        visitor = AsyncVisitor()
-        visitor.visit(node)
-        return patterns
-    
-    def _extract_event_usage_from_node(self, node: ast.AST, source_code: str) -> List[EventUsage]:
-        """Extract event usage patterns from an AST node."""
-        events = []
-        
-        if not self._compiled_patterns:
-            return events
-        
-        parser = self
-        
-        class EventVisitor(ast.NodeVisitor):
-            def visit_Call(self, call_node):
-                call_chain = parser._extract_call_chain(call_node.func)
-                if call_chain:
-                    call_text = '.'.join(call_chain)
-                    
-                    # Check against compiled patterns
-                    for pattern_config in parser._compiled_patterns:
-                        pattern_name = pattern_config['name']
-                        
-                        # Check publisher patterns
-                        for pub_pattern in pattern_config['publisher_patterns']:
-                            if pub_pattern.search(call_text):
-                                event_type = parser._extract_event_type_from_call(call_node, pattern_config)
-                                if event_type:
-                                    location = Location(
-                                        file_path=Path(""),
-                                        line_start=call_node.lineno,
-                                        line_end=getattr(call_node, 'end_lineno', call_node.lineno)
-                                    )
-                                    events.append(EventUsage(
-                                        event_type=event_type,
-                                        pattern_name=pattern_name,
-                                        is_publisher=True,
-                                        is_subscriber=False,
-                                        location=location,
-                                        context=call_text
-                                    ))
-                                break
-                        
-                        # Check subscriber patterns
-                        for sub_pattern in pattern_config['subscriber_patterns']:
-                            if sub_pattern.search(call_text):
-                                event_type = parser._extract_event_type_from_call(call_node, pattern_config)
-                                if event_type:
-                                    location = Location(
-                                        file_path=Path(""),
-                                        line_start=call_node.lineno,
-                                        line_end=getattr(call_node, 'end_lineno', call_node.lineno)
-                                    )
-                                    events.append(EventUsage(
-                                        event_type=event_type,
-                                        pattern_name=pattern_name,
-                                        is_publisher=False,
-                                        is_subscriber=True,
-                                        location=location,
-                                        context=call_text
-                                    ))
-                                break
-                
-                self.generic_visit(call_node)
+    def _extract_event_type_from_call(
+        self,
+        call_node: ast.Call,
+        extract_pattern: re.Pattern,
+        call_sources: Optional[Dict[int, str]] = None,
+        from_call_text: bool = True
+    ) -> Optional[str]:
+        """
+        Extract event type from a function call using the pattern's
+        extract_event_type regex.
         
-        visitor = EventVisitor()
-        visitor.visit(node)
-        return events
-    
-    def _extract_event_type_from_call(self, call_node: ast.Call, pattern_config: dict) -> Optional[str]:
-        """Extract event type from a function call using the pattern's regex."""
+        String arguments are tried first; the unparsed call is only searched
+        when from_call_text is set. call_sources, keyed by node id, lets
+        several patterns checked against the same call share one unparse of it.
+        """
+        search = extract_pattern.search
         try:
             # Try to extract from string arguments
             for arg in call_node.args:
-                if isinstance(arg, ast.Constant) and isinstance(arg.value, str):
-                    match = pattern_config['extract_event_type'].search(arg.value)
-                    if match:
-                        return match.group(1)
-                elif isinstance(arg, ast.Str):  # Python < 3.8 compatibility
-                    match = pattern_config['extract_event_type'].search(arg.s)
+                if type(arg) is ast.Constant and type(arg.value) is str:
+                    match = search(arg.value)
                     if match:
                         return match.group(1)
             
+            if not from_call_text:
+                return None
+            
             # Try to extract from the call itself (for decorator patterns)
-            call_str = self._ast_to_string(call_node)
-            match = pattern_config['extract_event_type'].search(call_str)
+            call_str = call_sources.get(id(call_node)) if call_sources is not None else None
+            if call_str is None:
+                call_str = self._ast_to_string(call_node)
+                if call_sources is not None:
+                    call_sources[id(call_node)] = call_str
+            match = search(call_str)
             if match:
                 return match.group(1)
                 
@@ -820,24 +1007,297 @@ class EnhancedASTParser:
         
         return None
     
-    def _count_comment_lines(self, source_code: str) -> int:
-        """Count lines that are primarily comments."""
+    def _scan_source_lines(self, source_code: str) -> Tuple[int, int, int, List[str]]:
+        """
+        Count total, blank and comment lines and collect TODO/FIXME comments
+        from one split of the source.
+        """
+        lines = source_code.splitlines()
+        blank_lines = 0
         comment_lines = 0
-        for line in source_code.splitlines():
-            stripped = line.strip()
-            if stripped.startswith('#'):
+        for line in lines:
+            # Only leading whitespace matters for both checks
+            stripped = line.lstrip()
+            if not stripped:
+                blank_lines += 1
+            elif stripped[0] == '#':
                 comment_lines += 1
-        return comment_lines
-    
-    def _extract_todos(self, source_code: str) -> List[str]:
-        """Extract TODO/FIXME comments from source code."""
-        todo_pattern = re.compile(r'#\s*(TODO|FIXME|XXX|HACK)\s*:?\s*(.*)', re.IGNORECASE)
+        
+        # Most files have no markers at all; the rest reuse the split lines
         todos = []
+        if _TODO_MARKER.search(source_code):
+            for line_num, line in enumerate(lines, 1):
+                if '#' not in line:
+                    continue
+                match = _TODO_PATTERN.search(line)
+                if match:
+                    todo_type, todo_text = match.groups()
+                    todos.append(f"Line {line_num}: {todo_type}: {todo_text.strip()}")
+        
+        return len(lines), blank_lines, comment_lines, todos
+
+
+class _BodyVisitor(ast.NodeVisitor):
+    """
+    Single-pass visitor collecting everything the parser derives from a
+    function or class subtree: calls, type references, async patterns,
+    event usage, generator status and cyclomatic complexity.
+    """
+    
+    # Node class → unbound visit method, resolved once per class instead of
+    # building 'visit_<ClassName>' and looking it up for every node
+    _dispatch: Dict[type, Any] = {}
+    
+    def __init__(self, parser: EnhancedASTParser):
+        self.parser = parser
+        self.calls: List[CallRef] = []
+        self.type_references: List[TypeRef] = []
+        self.async_patterns: List[AsyncPattern] = []
+        self.event_usage: List[EventUsage] = []
+        self.has_yield = False
+        self.complexity = 1  # Base complexity
+    
+    def visit(self, node: ast.AST):
+        node_class = type(node)
+        method = self._dispatch.get(node_class)
+        if method is None:
+            method = self._dispatch[node_class] = getattr(
+                _BodyVisitor, 'visit_' + node_class.__name__, _BodyVisitor.generic_visit
+            )
+        return method(self, node)
+    
+    def generic_visit(self, node: ast.AST):
+        # Same walk as ast.NodeVisitor.generic_visit, but reads _fields
+        # directly and dispatches inline rather than through iter_fields()
+        # and a second call into visit() per child; leaves are not called at all
+        dispatch = self._dispatch
+        visit = self.visit
+        leaf = _BodyVisitor._visit_leaf
+        for field_name in node._fields:
+            value = getattr(node, field_name, None)
+            if type(value) is list:
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        method = dispatch.get(type(item))
+                        if method is None:
+                            visit(item)
+                        elif method is not leaf:
+                            method(self, item)
+            elif isinstance(value, ast.AST):
+                method = dispatch.get(type(value))
+                if method is None:
+                    visit(value)
+                elif method is not leaf:
+                    method(self, value)
+    
+    # Calls, async task creation and events
+    
+    def visit_Call(self, node: ast.Call):
+        parser = self.parser
+        call_chain = parser._extract_call_chain(node.func)
+        if call_chain:
+            self.calls.append(CallRef(
+                call_chain=call_chain,
+                is_async=isinstance(node.func, ast.Attribute) and 
+                        node.func.attr in {'create_task', 'gather', 'wait_for'}
+            ))
+            
+            # Check for asyncio task creation patterns
+            func_name = call_chain[-1]
+            if func_name in ('create_task', 'ensure_future'):
+                self.async_patterns.append(AsyncPattern(
+                    pattern_type=AsyncPatternType.CREATE_TASK,
+                    location=self._location(node),
+                    details={'call_chain': call_chain, 'function': func_name}
+                ))
+            elif func_name == 'gather':
+                self.async_patterns.append(AsyncPattern(
+                    pattern_type=AsyncPatternType.GATHER,
+                    location=self._location(node),
+                    details={'call_chain': call_chain, 'arg_count': len(node.args)}
+                ))
+            
+            if parser._compiled_patterns:
+                call_text = '.'.join(call_chain)
+                prefilter = parser._event_prefilter
+                if prefilter is None or prefilter.search(call_text):
+                    self._collect_events(node, call_text)
         
-        for line_num, line in enumerate(source_code.splitlines(), 1):
-            match = todo_pattern.search(line)
-            if match:
-                todo_type, todo_text = match.groups()
-                todos.append(f"Line {line_num}: {todo_type}: {todo_text.strip()}")
+        self.generic_visit(node)
+    
+    def _collect_events(self, node: ast.Call, call_text: str) -> None:
+        """
+        Record publisher/subscriber usages of a call matching the event patterns.
+        
+        Every pattern role is checked: a call may legitimately be recorded
+        under several patterns (the default generic and Django patterns both
+        match `.send(...)`), so only the rest of a role stops at its first match.
+        """
+        parser = self.parser
+        call_sources: Dict[int, str] = {}
+        # Locations are never modified after parsing, so every usage
+        # recorded for this call shares one
+        location = None
+        for pattern_name, is_publisher, anchors, role_patterns, extract_pattern, from_call_text in parser._event_roles:
+            if anchors is not None:
+                # Substring checks rule out most roles before any regex runs
+                for anchor in anchors:
+                    if anchor in call_text:
+                        break
+                else:
+                    continue
+            for role_pattern in role_patterns:
+                if role_pattern.search(call_text):
+                    event_type = parser._extract_event_type_from_call(
+                        node, extract_pattern, call_sources, from_call_text
+                    )
+                    if event_type:
+                        # Event types and call sites repeat across a codebase
+                        # and key the indexer's event flows and context lookups
+                        call_text = sys.intern(call_text)
+                        if location is None:
+                            location = self._location(node)
+                        self.event_usage.append(EventUsage(
+                            event_type=sys.intern(event_type),
+                            pattern_name=pattern_name,
+                            is_publisher=is_publisher,
+                            is_subscriber=not is_publisher,
+                            location=location,
+                            context=call_text
+                        ))
+                    break
+    
+    # Type references
+    
+    def visit_arg(self, node: ast.arg):
+        if node.annotation:
+            self._add_type_reference(node.annotation)
+        self.generic_visit(node)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        # Return type annotation
+        if node.returns:
+            self._add_type_reference(node.returns)
+        self.generic_visit(node)
+    
+    def visit_AnnAssign(self, node: ast.AnnAssign):
+        # Variable type annotations
+        if node.annotation:
+            self._add_type_reference(node.annotation)
+        self.generic_visit(node)
+    
+    def _add_type_reference(self, annotation: ast.AST) -> None:
+        type_ref = self.parser._parse_type_annotation(annotation)
+        if type_ref:
+            self.type_references.append(type_ref)
+    
+    # Async patterns
+    
+    def visit_AsyncFunctionDef(self, node: ast.AsyncFunctionDef):
+        # Check for factory method pattern
+        is_factory = (
+            any(self.parser._decorator_name(dec) == 'classmethod' for dec in node.decorator_list) and
+            node.name in ('create', 'from_config', 'build', 'make')
+        )
         
-        return todos
\ No newline at end of file
+        if is_factory:
+            self.async_patterns.append(AsyncPattern(
+                pattern_type=AsyncPatternType.FACTORY_METHOD,
+                location=self._location(node),
+                details={'method_name': node.name}
+            ))
+        else:
+            # Bodies are always walked from a named function or class, so
+            # nested async definitions count as methods
+            self.async_patterns.append(AsyncPattern(
+                pattern_type=AsyncPatternType.ASYNC_METHOD,
+                location=self._location(node),
+                details={'function_name': node.name}
+            ))
+        
+        self.generic_visit(node)
+    
+    def visit_AsyncWith(self, node: ast.AsyncWith):
+        context_managers = []
+        for item in node.items:
+            context_managers.append(self.parser._ast_to_string(item.context_expr))
+        
+        self.async_patterns.append(AsyncPattern(
+            pattern_type=AsyncPatternType.ASYNC_CONTEXT_MANAGER,
+            location=self._location(node),
+            details={'context_managers': context_managers}
+        ))
+        self.generic_visit(node)
+    
+    # Generators
+    
+    def _visit_yield(self, node: ast.AST):
+        self.has_yield = True
+        self.generic_visit(node)
+    
+    visit_Yield = visit_YieldFrom = _visit_yield
+    
+    # Complexity
+    
+    def _visit_branch(self, node: ast.AST):
+        self.complexity += 1
+        self.generic_visit(node)
+    
+    visit_If = visit_For = visit_While = visit_With = _visit_branch
+    
+    def visit_Try(self, node: ast.Try):
+        self.complexity += len(node.handlers)
+        self.generic_visit(node)
+    
+    # Subtrees that can hold nothing the visitor collects (no calls,
+    # annotations, branches or definitions)
+    
+    def _visit_leaf(self, node: ast.AST):
+        pass
+    
+    visit_Name = visit_Constant = visit_Load = visit_Store = visit_Del = _visit_leaf
+    visit_Pass = visit_Break = visit_Continue = visit_Global = visit_Nonlocal = _visit_leaf
+    visit_Import = visit_ImportFrom = visit_alias = _visit_leaf
+    
+    @staticmethod
+    def _location(node: ast.AST) -> Location:
+        # Positional arguments skip keyword matching for this per-node record
+        return Location(_UNSET_PATH, node.lineno, node.end_lineno or node.lineno)
+
+
+# Operator nodes are leaves too; there are too many to alias one by one
+_BodyVisitor._dispatch.update(dict.fromkeys(
+    [
+        leaf_class
+        for base in (ast.operator, ast.boolop, ast.unaryop, ast.cmpop)
+        for leaf_class in base.__subclasses__()
+    ],
+    _BodyVisitor._visit_leaf
+))
+
+
+# Process pool workers for EnhancedASTParser.parse_files
+
+_worker_parser: Optional[EnhancedASTParser] = None
+
+
+def _init_parse_worker(
+    event_patterns: List[dict],
+    cache_dir: Optional[Path],
+    keep_source: bool
+) -> None:
+    """Build the parser each worker process reuses for all of its batches."""
+    global _worker_parser
+    _worker_parser = EnhancedASTParser(
+        event_patterns=event_patterns,
+        cache_dir=cache_dir,
+        keep_source=keep_source
+    )
+
+
+def _parse_batch(file_paths: List[Path]) -> Tuple[List[Union[Module, Exception]], int, int]:
+    """Parse a batch of files in a worker, returning results plus cache hits and misses."""
+    parser = _worker_parser
+    hits, misses = parser.cache_hits, parser.cache_misses
+    results = asyncio.run(parser.parse_files(file_paths, return_exceptions=True))
+    return results, parser.cache_hits - hits, parser.cache_misses - misses
@@ -5,7 +5,7 @@ Coordinates scanning, parsing, analysis, and generation phases to produce
 comprehensive documentation with smart cross-references.
 """
 
-import asyncio
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable, Awaitable
 import logging
@@ -60,12 +60,17 @@ class DocumentationProcessor:
         self.config = config
         self.stats = ProcessingStats()
         self._modules: List[Module] = []
+        self._modules_by_name: Optional[Dict[str, Module]] = None
+        self._modules_by_package: Optional[Dict[Optional[str], List[Module]]] = None
         self._index: Optional[CrossReferenceIndex] = None
         
         # Initialize components
         self._scanner = FileScanner(config.project.exclude_patterns)
+        parse_cache_dir = config.project.parse_cache_dir
         self._parser = EnhancedASTParser(
-            event_patterns=[pattern.dict() for pattern in config.events.patterns] if config.events.enabled else []
+            event_patterns=[pattern.model_dump() for pattern in config.events.patterns] if config.events.enabled else [],
+            cache_dir=Path(parse_cache_dir).expanduser() if parse_cache_dir else None,
+            keep_source=config.output.include_source
         )
         self._indexer = IndexBuilder()
     
@@ -167,37 +172,37 @@ class DocumentationProcessor:
         """Phase 2: Parse all files into Module objects."""
         logger.info("Phase 2: Parsing Python files...")
         
-        # Create semaphore to limit concurrent parsing
-        semaphore = asyncio.Semaphore(8)  # Limit concurrent file operations
-        
-        async def parse_file_with_semaphore(file_info: SourceFileInfo) -> Optional[Module]:
-            async with semaphore:
-                try:
-                    module = await self._parser.parse_file(file_info.path)
-                    self.stats.files_processed += 1
-                    
-                    # Accumulate statistics
-                    self.stats.classes_found += len(module.classes)
-                    self.stats.functions_found += len(module.get_all_functions())
-                    
-                    return module
-                except Exception as e:
-                    self.stats.files_failed += 1
-                    error_msg = f"Failed to parse {file_info.path}: {e}"
-                    self.stats.errors.append(error_msg)
-                    logger.warning(error_msg)
-                    return None
+        # Parse all files concurrently, collecting per-file failures
+        file_paths = [file_info.path for file_info in self._file_infos]
+        results = await self._parser.parse_files(
+            file_paths,
+            return_exceptions=True,
+            workers=self.config.project.parse_workers
+        )
         
-        # Parse all files concurrently
-        parse_tasks = [parse_file_with_semaphore(info) for info in self._file_infos]
-        modules = await asyncio.gather(*parse_tasks)
+        self._modules = []
+        self._modules_by_name = None
+        self._modules_by_package = None
+        for file_path, result in zip(file_paths, results):
+            if isinstance(result, Exception):
+                self.stats.files_failed += 1
+                error_msg = f"Failed to parse {file_path}: {result}"
+                self.stats.errors.append(error_msg)
+                logger.warning(error_msg)
+                continue
+            
+            self._modules.append(result)
         
-        # Filter out failed parses
-        self._modules = [module for module in modules if module is not None]
+        # Accumulate statistics once all modules are in
+        self.stats.files_processed += len(self._modules)
+        self.stats.classes_found += sum(len(module.classes) for module in self._modules)
+        self.stats.functions_found += sum(len(module.get_all_functions()) for module in self._modules)
         self.stats.modules_created = len(self._modules)
         
         logger.info(f"Parsed {self.stats.modules_created} modules successfully "
                    f"({self.stats.files_failed} failed)")
+        if self._parser.cache_dir is not None:
+            logger.info(f"Parse cache: {self._parser.cache_hits} hits, {self._parser.cache_misses} misses")
         
         return self._modules
     
@@ -257,7 +262,7 @@ class DocumentationProcessor:
     
     async def _write_generation_status(self, status_file: Path) -> None:
         """Write a status file showing what was processed."""
-        content = f"""# Documentation Generation Status
+        parts = [f"""# Documentation Generation Status
 
 Generated on: {self.stats.processing_time:.2f}s
 
@@ -282,20 +287,21 @@ Generated on: {self.stats.processing_time:.2f}s
 
 ## Modules Processed
 
-"""
+"""]
         
-        for module in self._modules:
-            content += f"- **{module.name}** ({len(module.classes)} classes, {len(module.functions)} functions)\n"
+        parts.extend(
+            f"- **{module.name}** ({len(module.classes)} classes, {len(module.functions)} functions)\n"
+            for module in self._modules
+        )
         
         if self.stats.errors:
-            content += "\n## Errors\n\n"
-            for error in self.stats.errors:
-                content += f"- {error}\n"
+            parts.append("\n## Errors\n\n")
+            parts.extend(f"- {error}\n" for error in self.stats.errors)
         
         # Write the file
         import aiofiles
         async with aiofiles.open(status_file, 'w', encoding='utf-8') as f:
-            await f.write(content)
+            await f.write("".join(parts))
     
     def _log_final_stats(self) -> None:
         """Log final processing statistics."""
@@ -332,14 +338,26 @@ Generated on: {self.stats.processing_time:.2f}s
     
     def get_module_by_name(self, name: str) -> Optional[Module]:
         """Get a module by name."""
-        for module in self._modules:
-            if module.name == name:
-                return module
-        return None
+        if self._modules_by_name is None:
+            self._build_module_lookups()
+        return self._modules_by_name.get(name)
     
     def get_modules_by_package(self, package: str) -> List[Module]:
         """Get all modules in a package."""
-        return [module for module in self._modules if module.package == package]
+        if self._modules_by_package is None:
+            self._build_module_lookups()
+        return list(self._modules_by_package.get(package, ()))
+    
+    def _build_module_lookups(self) -> None:
+        """Index the parsed modules by name and package for repeated lookups."""
+        modules_by_name: Dict[str, Module] = {}
+        modules_by_package: Dict[Optional[str], List[Module]] = defaultdict(list)
+        for module in self._modules:
+            # First module wins on duplicate names, as with the earlier linear scan
+            modules_by_name.setdefault(module.name, module)
+            modules_by_package[module.package].append(module)
+        self._modules_by_name = modules_by_name
+        self._modules_by_package = dict(modules_by_package)
     
     def get_processing_summary(self) -> Dict[str, Any]:
         """Get a summary of processing results."""
@@ -6,11 +6,34 @@ for cross-referencing, type analysis, and documentation generation.
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Union
 from enum import Enum
 
+# Slotted dataclasses (3.10+) drop the per-instance __dict__ from the
+# element records the parser creates in bulk
+_SLOTS: Dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+def _pickle_as_arguments(cls):
+    """
+    Pickle instances as their constructor arguments in field order.
+    
+    Dumping a tuple of field values is much cheaper than the default
+    per-instance slot state dict. Only for records that cannot reference
+    themselves, since constructor arguments cannot express cycles.
+    """
+    get_fields = attrgetter(*(f.name for f in fields(cls)))
+    
+    def __reduce__(self):
+        return cls, get_fields(self)
+    
+    cls.__reduce__ = __reduce__
+    return cls
+
 
 class VisibilityLevel(Enum):
     """Code element visibility levels."""
@@ -31,7 +54,8 @@ class AsyncPatternType(Enum):
     FACTORY_METHOD = "factory_method"  # @classmethod async def create()
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class Location:
     """Source code location information."""
     file_path: Path
@@ -41,7 +65,8 @@ class Location:
     column_end: int = 0
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class TypeRef:
     """Reference to a type with linking information."""
     name: str
@@ -55,7 +80,8 @@ class TypeRef:
     anchor: Optional[str] = None  # Link anchor if internal type
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class Parameter:
     """Function/method parameter with rich type information."""
     name: str
@@ -67,7 +93,8 @@ class Parameter:
     is_keyword_only: bool = False
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class EventUsage:
     """Event usage pattern detected in code."""
     event_type: str
@@ -78,7 +105,8 @@ class EventUsage:
     is_subscriber: bool = False
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class AsyncPattern:
     """Async pattern detected in code."""
     pattern_type: AsyncPatternType
@@ -86,7 +114,8 @@ class AsyncPattern:
     details: Dict[str, Any] = field(default_factory=dict)  # Pattern-specific details
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class CallRef:
     """Reference to a function/method call with linking info."""
     call_chain: List[str]
@@ -96,7 +125,8 @@ class CallRef:
     is_async: bool = False
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class ImportStatement:
     """Import statement with resolution information."""
     names: List[tuple[str, Optional[str]]]  # [(name, alias), ...]
@@ -107,7 +137,8 @@ class ImportStatement:
     is_internal: bool = False  # Whether this imports from our codebase
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class Decorator:
     """Decorator information."""
     name: str
@@ -115,7 +146,7 @@ class Decorator:
     is_builtin: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Function:
     """Enhanced function/method representation."""
     name: str
@@ -150,15 +181,23 @@ class Function:
     complexity: int = 0
     lines_of_code: int = 0
     
+    # Unprefixed anchor, computed on first use
+    _anchor: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def get_anchor(self, prefix: str = "") -> str:
         """Generate markdown anchor for this function."""
         base = "method" if self.parent_class else "function"
         if prefix:
             return f"{prefix}-{base}-{self.name.lower().replace('_', '-')}"
-        return f"{base}-{self.name.lower().replace('_', '-')}"
+        if self._anchor is None:
+            self._anchor = f"{base}-{self.name.lower().replace('_', '-')}"
+        return self._anchor
 
 
-@dataclass
+@_pickle_as_arguments
+@dataclass(**_SLOTS)
 class Attribute:
     """Class or instance attribute."""
     name: str
@@ -172,7 +211,7 @@ class Attribute:
     visibility: VisibilityLevel = VisibilityLevel.PUBLIC
 
 
-@dataclass  
+@dataclass(**_SLOTS)
 class Class:
     """Enhanced class representation."""
     name: str
@@ -201,14 +240,21 @@ class Class:
     public_method_count: int = 0
     lines_of_code: int = 0
     
+    # Unprefixed anchor, computed on first use
+    _anchor: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def get_anchor(self, prefix: str = "") -> str:
         """Generate markdown anchor for this class."""
         if prefix:
             return f"{prefix}-class-{self.name.lower().replace('_', '-')}"
-        return f"class-{self.name.lower().replace('_', '-')}"
+        if self._anchor is None:
+            self._anchor = f"class-{self.name.lower().replace('_', '-')}"
+        return self._anchor
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Module:
     """Enhanced module representation."""
     name: str
@@ -240,6 +286,16 @@ class Module:
     lines_blank: int = 0
     complexity_total: int = 0
     
+    # Flattened views, computed on first use. Only the parser adds classes
+    # and functions, and it never reads these views; anything that changes
+    # a module's structure later must reset both fields to None
+    _all_functions: Optional[List[Function]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _all_types: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def get_anchor(self, prefix: str = "") -> str:
         """Generate markdown anchor for this module."""
         if prefix:
@@ -248,27 +304,36 @@ class Module:
     
     def get_all_functions(self) -> List[Function]:
         """Get all functions including class methods."""
-        functions = list(self.functions)
-        for cls in self.classes:
-            functions.extend(cls.methods)
-            # Include nested functions recursively
-            for method in cls.methods:
-                functions.extend(self._get_nested_functions(method))
-        return functions
+        if self._all_functions is None:
+            functions = list(self.functions)
+            for cls in self.classes:
+                functions.extend(cls.methods)
+                # Include nested functions recursively
+                for method in cls.methods:
+                    self._collect_nested_functions(method, functions)
+            self._all_functions = functions
+        return list(self._all_functions)
     
-    def _get_nested_functions(self, func: Function) -> List[Function]:
-        """Recursively get all nested functions."""
-        nested = list(func.nested_functions)
-        for nested_func in func.nested_functions:
-            nested.extend(self._get_nested_functions(nested_func))
-        return nested
+    @staticmethod
+    def _collect_nested_functions(func: Function, out: List[Function]) -> None:
+        """
+        Append all functions nested under func to out: each function's direct
+        children first, then each child's own nested functions in turn.
+        """
+        stack = [func]
+        while stack:
+            current = stack.pop()
+            out.extend(current.nested_functions)
+            stack.extend(reversed(current.nested_functions))
     
     def get_all_types(self) -> List[str]:
         """Get all type names defined in this module."""
-        types = []
-        for cls in self.classes:
-            types.append(cls.name)
-            # Include nested classes
-            for nested_cls in cls.nested_classes:
-                types.append(f"{cls.name}.{nested_cls.name}")
-        return types
\ No newline at end of file
+        if self._all_types is None:
+            types = []
+            for cls in self.classes:
+                types.append(cls.name)
+                # Include nested classes
+                for nested_cls in cls.nested_classes:
+                    types.append(f"{cls.name}.{nested_cls.name}")
+            self._all_types = types
+        return list(self._all_types)
\ No newline at end of file
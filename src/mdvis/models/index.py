@@ -8,10 +8,10 @@ code elements to enable smart linking and navigation.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Sequence, Set, Tuple
 from enum import Enum
 
-from .elements import Module, Class, Function, Location
+from .elements import Module, Class, Function, Location, _SLOTS
 
 
 class ReferenceType(Enum):
@@ -26,7 +26,7 @@ class ReferenceType(Enum):
     EVENT_SUBSCRIBER = "event_subscriber"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ElementRef:
     """Reference to a code element with navigation info."""
     name: str
@@ -47,7 +47,7 @@ class ElementRef:
             return f"[[{self.module}#{self.anchor}]]"
 
 
-@dataclass  
+@dataclass(**_SLOTS)
 class ImportResolution:
     """Resolved import statement."""
     original_import: str  # Original import statement
@@ -57,7 +57,7 @@ class ImportResolution:
     targets: List[ElementRef] = field(default_factory=list)  # What the imports resolve to
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TypeResolution:
     """Resolved type reference."""
     type_name: str
@@ -68,7 +68,7 @@ class TypeResolution:
     generic_args: List[TypeResolution] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CallResolution:
     """Resolved function/method call."""
     call_chain: List[str]
@@ -77,7 +77,7 @@ class CallResolution:
     confidence: float = 1.0  # How confident we are in the resolution
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class EventFlow:
     """Event flow from publisher to subscribers."""
     event_type: str
@@ -86,7 +86,7 @@ class EventFlow:
     pattern_name: str = "unknown"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DependencyEdge:
     """Dependency relationship between modules."""
     source_module: str
@@ -135,6 +135,10 @@ class CrossReferenceIndex:
     # Dependencies
     module_dependencies: List[DependencyEdge] = field(default_factory=list)
     dependency_graph: Dict[str, Set[str]] = field(default_factory=dict)
+    # (source, target, dependency type) → edge in module_dependencies
+    _dependency_edges: Dict[Tuple[str, str, ReferenceType], DependencyEdge] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
     
     def register_module(self, module: Module) -> None:
         """Register a module and all its elements in the index."""
@@ -318,29 +322,35 @@ class CrossReferenceIndex:
     
     def add_dependency(self, source: str, target: str, dep_type: ReferenceType, example: str = "") -> None:
         """Add a dependency relationship between modules."""
-        # Find existing edge or create new one
-        existing = None
-        for edge in self.module_dependencies:
-            if edge.source_module == source and edge.target_module == target and edge.dependency_type == dep_type:
-                existing = edge
-                break
-        
-        if existing:
-            existing.strength += 1
-            if example and example not in existing.examples:
-                existing.examples.append(example)
-        else:
-            self.module_dependencies.append(DependencyEdge(
-                source_module=source,
-                target_module=target,
-                dependency_type=dep_type,
-                examples=[example] if example else []
-            ))
+        self.add_dependencies(((source, target, dep_type, example),))
+    
+    def add_dependencies(self, dependencies: Sequence[Tuple[str, str, ReferenceType, str]]) -> None:
+        """Add a batch of (source, target, dependency type, example) relationships."""
+        if not dependencies:
+            return
         
-        # Update dependency graph
-        if source not in self.dependency_graph:
-            self.dependency_graph[source] = set()
-        self.dependency_graph[source].add(target)
+        edges = self._dependency_edges
+        for source, target, dep_type, example in dependencies:
+            # Find existing edge or create new one
+            existing = edges.get((source, target, dep_type))
+            if existing:
+                existing.strength += 1
+                if example and example not in existing.examples:
+                    existing.examples.append(example)
+            else:
+                edge = DependencyEdge(
+                    source_module=source,
+                    target_module=target,
+                    dependency_type=dep_type,
+                    examples=[example] if example else []
+                )
+                self.module_dependencies.append(edge)
+                edges[(source, target, dep_type)] = edge
+            
+            # Update dependency graph
+            if source not in self.dependency_graph:
+                self.dependency_graph[source] = set()
+            self.dependency_graph[source].add(target)
     
     def get_module_dependencies(self, module_name: str) -> List[DependencyEdge]:
         """Get all dependencies for a specific module."""
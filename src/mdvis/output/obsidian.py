@@ -6,20 +6,39 @@ with proper wikilinks, anchors, and cross-references using templates and visuali
 """
 
 import asyncio
-import aiofiles
+import functools
+from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set
+from typing import List, Dict, DefaultDict, Any, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
 from ..config.schema import MDVisConfig
-from ..models.elements import Module, Class, Function, Parameter, ImportStatement, VisibilityLevel
+from ..models.elements import Module, Class, Function, Parameter, ImportStatement
 from ..models.index import CrossReferenceIndex
-from .templates import create_template_manager
+from .templates import create_template_manager, _verbosity_profile
 from .visualizations import create_mermaid_generator
 
 logger = logging.getLogger(__name__)
 
+# How many rendered module docs may wait in memory before rendering pauses
+# for the writers to catch up
+_WRITE_QUEUE_SIZE = 32
+
+# Fixed heading lines of fallback pages, each followed by its blank line;
+# extending with one of these replaces a pair of appends
+_FRONTMATTER_END = ("---", "")
+_CLASSES_HEADING = ("## Classes", "")
+_FUNCTIONS_HEADING = ("## Functions", "")
+_ATTRIBUTES_HEADING = ("#### Attributes", "")
+_METHODS_HEADING = ("#### Methods", "")
+_SOURCE_HEADING = ("## Source Code", "")
+
+
+def _timestamp() -> str:
+    """Format the current time the way generated pages display it."""
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
 
 class ObsidianGenerator:
     """
@@ -39,6 +58,18 @@ class ObsidianGenerator:
         self.index = index
         self.project_root = project_root or Path.cwd()  # Default to current directory
         self._generated_files: Set[Path] = set()
+        self._include_private = config.output.include_private
+        self._verbosity_profile = _verbosity_profile(config.verbosity)
+        self._mirror_structure = config.output.structure == "mirror"
+        self._created_dirs: Set[Path] = set()
+        self._run_timestamp = _timestamp()
+        
+        # The index is complete by the time a generator exists, so module
+        # membership and name resolution can be computed once per name
+        self._module_names = frozenset(index.module_paths)
+        self._resolve_import = functools.lru_cache(maxsize=4096)(index.resolve_import)
+        self._resolve_type = functools.lru_cache(maxsize=4096)(index.resolve_type)
+        self._call_links: Dict[Tuple[Tuple[str, ...], str], str] = {}
         
         # Initialize template manager and visualization generator
         self.template_manager = create_template_manager(config.verbosity)
@@ -64,31 +95,39 @@ class ObsidianGenerator:
         """
         logger.info(f"Generating Obsidian documentation for {len(modules)} modules")
         
+        # Every page generated in this run carries the same timestamp
+        self._run_timestamp = _timestamp()
+        
         # Create output directory structure
         await self._setup_output_structure(output_root)
         
-        # Generate module documentation concurrently
-        semaphore = asyncio.Semaphore(5)  # Limit concurrent file writes
-        
-        async def generate_module_with_semaphore(module: Module) -> None:
-            async with semaphore:
-                await self._generate_module_documentation(module, output_root)
-        
-        # Generate all module docs
-        await asyncio.gather(*[
-            generate_module_with_semaphore(module) for module in modules
-        ])
-        
-        # Generate dashboard/index
-        await self._generate_dashboard(modules, output_root)
+        # Render module docs while a small pool of writers drains them to disk
+        writer_count = self.config.output.max_concurrent_writes
+        queue: asyncio.Queue = asyncio.Queue(maxsize=max(_WRITE_QUEUE_SIZE, writer_count))
+        writers = [
+            asyncio.create_task(self._write_queued_files(queue))
+            for _ in range(writer_count)
+        ]
+        try:
+            for module in modules:
+                await self._generate_module_documentation(module, output_root, queue)
+        finally:
+            for _ in writers:
+                await queue.put(None)
+            for written in await asyncio.gather(*writers):
+                self._generated_files.update(written)
+        
+        # Dashboard/index, visualizations and event docs are independent of
+        # each other, so let their rendering and writes overlap
+        pages = [self._generate_dashboard(modules, output_root)]
         
-        # Generate visualizations if enabled
         if self.config.visualization.generate_dependency_graph:
-            await self._generate_dependency_visualization(modules, output_root)
+            pages.append(self._generate_dependency_visualization(modules, output_root))
         
-        # Generate event documentation if enabled
         if self.config.events.enabled and self.index.event_flows:
-            await self._generate_event_documentation(output_root)
+            pages.append(self._generate_event_documentation(output_root))
+        
+        await asyncio.gather(*pages)
         
         logger.info(f"Generated {len(self._generated_files)} documentation files")
     
@@ -103,11 +142,16 @@ class ObsidianGenerator:
                 output_dir = output_root / relative_dir
                 output_dir.mkdir(parents=True, exist_ok=True)
     
-    async def _generate_module_documentation(self, module: Module, output_root: Path) -> None:
-        """Generate documentation for a single module."""
+    async def _generate_module_documentation(
+        self, 
+        module: Module, 
+        output_root: Path, 
+        queue: asyncio.Queue
+    ) -> None:
+        """Render documentation for a single module and queue it for writing."""
         try:
             # Determine output path
-            if self.config.output.structure == "mirror":
+            if self._mirror_structure:
                 try:
                     # Try to make path relative to project root
                     relative_path = module.file_path.relative_to(self.project_root)
@@ -119,68 +163,92 @@ class ObsidianGenerator:
                 # Flatten structure
                 output_path = output_root / f"{module.name}.md"
             
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # Ensure output directory exists (once per directory)
+            output_dir = output_path.parent
+            if output_dir not in self._created_dirs:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                self._created_dirs.add(output_dir)
             
             # Generate content
             content = await self._generate_module_content(module)
             
-            # Write file
-            async with aiofiles.open(output_path, 'w', encoding='utf-8') as f:
-                await f.write(content)
-            
-            self._generated_files.add(output_path)
-            logger.debug(f"Generated documentation: {output_path}")
+            await queue.put((output_path, module.name, content))
             
         except Exception as e:
             logger.error(f"Error generating documentation for {module.name}: {e}")
+    
+    async def _write_queued_files(self, queue: asyncio.Queue) -> List[Path]:
+        """Write queued module documents until a ``None`` sentinel arrives.
+        
+        Returns:
+            Paths of the files this writer wrote successfully
+        """
+        written: List[Path] = []
+        while True:
+            item = await queue.get()
+            if item is None:
+                return written
+            
+            output_path, module_name, content = item
+            try:
+                await self._write_file(output_path, content)
+                
+                written.append(output_path)
+                logger.debug(f"Generated documentation: {output_path}")
+                
+            except Exception as e:
+                logger.error(f"Error generating documentation for {module_name}: {e}")
 
-    def _generate_frontmatter(self, module: Module) -> List[str]:
+    async def _write_file(self, path: Path, content: str) -> None:
+        """Write a markdown file with a single executor hop."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, path.write_bytes, content.encode('utf-8'))
+    
+    def _generate_frontmatter(self, module: Module, out: List[str]) -> None:
         """Generate YAML frontmatter for the module."""
-        lines = ["---"]
-        lines.append(f"title: {module.name}")
-        lines.append("type: module")
-        lines.append(f"file_path: {module.file_path}")
+        out.append("---")
+        out.append(f"title: {module.name}")
+        out.append("type: module")
+        out.append(f"file_path: {module.file_path}")
         
         if module.package:
-            lines.append(f"package: {module.package}")
+            out.append(f"package: {module.package}")
         
         # Statistics
-        lines.append("stats:")
-        lines.append(f"  classes: {len(module.classes)}")
-        lines.append(f"  functions: {len(module.functions)}")
-        lines.append(f"  lines_of_code: {module.lines_of_code}")
-        lines.append(f"  complexity: {sum(func.complexity for func in module.get_all_functions())}")
+        out.append("stats:")
+        out.append(f"  classes: {len(module.classes)}")
+        out.append(f"  functions: {len(module.functions)}")
+        out.append(f"  lines_of_code: {module.lines_of_code}")
+        all_functions = module.get_all_functions()
+        out.append(f"  complexity: {sum(func.complexity for func in all_functions)}")
         
         # Tags
         tags = ["python", "module"]
         if module.classes:
             tags.append("oop")
-        if any(func.is_async for func in module.get_all_functions()):
+        if any(func.is_async for func in all_functions):
             tags.append("async")
         if module.event_usage:
             tags.append("events")
         
-        lines.append("tags:")
+        out.append("tags:")
         for tag in tags:
-            lines.append(f"  - {tag}")
-        
-        lines.append("---")
-        lines.append("")
+            out.append(f"  - {tag}")
         
-        return lines
+        out.extend(_FRONTMATTER_END)
     
     async def _generate_module_content(self, module: Module) -> str:
         """Generate the markdown content for a module using templates."""
+        output_config = self.config.output
         try:
             # Use template manager for rendering
             content = self.template_manager.render_module(
                 module=module,
                 index=self.index,
                 config=self.config,
-                include_source=self.config.output.include_source,
-                source_position=self.config.output.source_position,
-                include_private=self.config.output.include_private
+                include_source=output_config.include_source,
+                source_position=output_config.source_position,
+                include_private=self._include_private
             )
             return content
         except Exception as e:
@@ -190,10 +258,18 @@ class ObsidianGenerator:
     
     async def _generate_module_content_fallback(self, module: Module) -> str:
         """Fallback module content generation without templates."""
-        lines = []
+        # Pure string building; run it off the event loop so queued writes
+        # keep draining while the page is assembled
+        return await asyncio.to_thread(self._build_module_markdown, module)
+    
+    def _build_module_markdown(self, module: Module) -> str:
+        """Assemble the fallback markdown page for a module."""
+        output_config = self.config.output
+        source_position = output_config.source_position if output_config.include_source else None
+        lines: List[str] = []
         
         # Frontmatter
-        lines.extend(self._generate_frontmatter(module))
+        self._generate_frontmatter(module, lines)
         
         # Title
         lines.append(f"# {module.name}")
@@ -201,137 +277,96 @@ class ObsidianGenerator:
         
         # Module docstring
         if module.docstring:
-            lines.extend(self._format_docstring(module.docstring))
+            self._format_docstring(module.docstring, lines)
             lines.append("")
         
         # Table of contents (if enabled)
-        if self.config.output.generate_toc:
-            toc = self._generate_table_of_contents(module)
-            if toc:
-                lines.extend(toc)
-                lines.append("")
+        if output_config.generate_toc:
+            self._generate_table_of_contents(module, lines)
+            lines.append("")
         
         # Source code (at top if configured)
-        if self.config.output.include_source and self.config.output.source_position == "top":
-            lines.extend(self._generate_source_section(module))
+        if source_position == "top":
+            self._generate_source_section(module, lines)
             lines.append("")
         
         # Imports
         if module.imports:
-            lines.extend(self._generate_imports_section(module))
+            self._generate_imports_section(module, lines)
             lines.append("")
         
         # Classes
         if module.classes:
-            lines.append("## Classes")
-            lines.append("")
-            for cls in module.classes:
-                if self._should_include_element(cls.name):
-                    lines.extend(self._generate_class_section(cls, module))
-                    lines.append("")
+            lines.extend(_CLASSES_HEADING)
+            for cls in self._filter_visible(module.classes):
+                self._generate_class_section(cls, module, lines)
+                lines.append("")
         
         # Functions
         if module.functions:
-            lines.append("## Functions")
-            lines.append("")
-            for func in module.functions:
-                if self._should_include_element(func.name):
-                    lines.extend(self._generate_function_section(func, module))
-                    lines.append("")
+            lines.extend(_FUNCTIONS_HEADING)
+            for func in self._filter_visible(module.functions):
+                self._generate_function_section(func, module, lines)
+                lines.append("")
         
         # TODOs
         if module.todos:
-            lines.extend(self._generate_todos_section(module.todos))
+            self._generate_todos_section(module.todos, lines)
             lines.append("")
         
         # Source code (at bottom if configured)
-        if self.config.output.include_source and self.config.output.source_position == "bottom":
-            lines.extend(self._generate_source_section(module))
+        if source_position == "bottom":
+            self._generate_source_section(module, lines)
         
         return "\n".join(lines)
-        """Generate YAML frontmatter for the module."""
-        lines = ["---"]
-        lines.append(f"title: {module.name}")
-        lines.append("type: module")
-        lines.append(f"file_path: {module.file_path}")
-        
-        if module.package:
-            lines.append(f"package: {module.package}")
-        
-        # Statistics
-        lines.append("stats:")
-        lines.append(f"  classes: {len(module.classes)}")
-        lines.append(f"  functions: {len(module.functions)}")
-        lines.append(f"  lines_of_code: {module.lines_of_code}")
-        lines.append(f"  complexity: {sum(func.complexity for func in module.get_all_functions())}")
-        
-        # Tags
-        tags = ["python", "module"]
-        if module.classes:
-            tags.append("oop")
-        if any(func.is_async for func in module.get_all_functions()):
-            tags.append("async")
-        if module.event_usage:
-            tags.append("events")
-        
-        lines.append("tags:")
-        for tag in tags:
-            lines.append(f"  - {tag}")
-        
-        lines.append("---")
-        lines.append("")
-        
-        return lines
     
-    def _generate_table_of_contents(self, module: Module) -> List[str]:
+    def _generate_table_of_contents(self, module: Module, out: List[str]) -> None:
         """Generate table of contents for the module."""
-        if self.config.output.toc_style == "collapsible":
-            lines = ["<details>", "<summary>Table of Contents</summary>", ""]
+        collapsible = self.config.output.toc_style == "collapsible"
+        if collapsible:
+            out.extend(["<details>", "<summary>Table of Contents</summary>", ""])
         else:
-            lines = ["## Table of Contents", ""]
+            out.extend(["## Table of Contents", ""])
         
         # Add classes
         if module.classes:
-            lines.append("### Classes")
-            for cls in module.classes:
-                if self._should_include_element(cls.name):
-                    anchor = cls.get_anchor()
-                    lines.append(f"- [[#{anchor}|{cls.name}]]")
-            lines.append("")
+            out.append("### Classes")
+            out.extend(
+                f"- [[#{cls.get_anchor()}|{cls.name}]]"
+                for cls in self._filter_visible(module.classes)
+            )
+            out.append("")
         
         # Add functions
         if module.functions:
-            lines.append("### Functions")
-            for func in module.functions:
-                if self._should_include_element(func.name):
-                    anchor = func.get_anchor()
-                    lines.append(f"- [[#{anchor}|{func.name}]]")
-            lines.append("")
-        
-        if self.config.output.toc_style == "collapsible":
-            lines.extend(["", "</details>"])
+            out.append("### Functions")
+            out.extend(
+                f"- [[#{func.get_anchor()}|{func.name}]]"
+                for func in self._filter_visible(module.functions)
+            )
+            out.append("")
         
-        return lines
+        if collapsible:
+            out.extend(["", "</details>"])
     
-    def _generate_imports_section(self, module: Module) -> List[str]:
+    def _generate_imports_section(self, module: Module, out: List[str]) -> None:
         """Generate the imports section."""
-        lines = ["## Imports", ""]
+        out.extend(["## Imports", ""])
         
         for import_stmt in module.imports:
             line = self._format_import_statement(import_stmt, module)
-            lines.append(line)
-        
-        return lines
+            out.append(line)
     
     def _format_import_statement(self, import_stmt: ImportStatement, module: Module) -> str:
         """Format an import statement with smart linking."""
+        module_names = self._module_names
         if import_stmt.module is None:
             # Direct imports: import os, sys
             names = []
             for name, alias in import_stmt.names:
                 display_name = alias or name
                 # Try to link to internal modules
-                if name in self.index.module_paths:
+                if name in module_names:
                     names.append(f"[[{name}|{display_name}]]")
                 else:
                     names.append(f"`{display_name}`")
@@ -339,148 +374,128 @@ class ObsidianGenerator:
         else:
             # From imports: from module import name
             module_name = import_stmt.module
-            module_link = f"[[{module_name}]]" if module_name in self.index.module_paths else f"`{module_name}`"
+            module_link = f"[[{module_name}]]" if module_name in module_names else f"`{module_name}`"
             
+            resolve_import = self._resolve_import
+            context = module.name
             names = []
             for name, alias in import_stmt.names:
                 display_name = alias or name
                 # Try to link to specific elements
-                element_ref = self.index.resolve_import(name, module.name)
-                if element_ref and element_ref.module in self.index.module_paths:
+                element_ref = resolve_import(name, context)
+                if element_ref and element_ref.module in module_names:
                     names.append(f"[[{element_ref.module}#{element_ref.anchor}|{display_name}]]")
                 else:
                     names.append(f"`{display_name}`")
             
             return f"- **from** {module_link} **import** {', '.join(names)}"
     
-    def _generate_class_section(self, cls: Class, module: Module) -> List[str]:
+    def _generate_class_section(self, cls: Class, module: Module, out: List[str]) -> None:
         """Generate documentation for a class."""
-        lines = []
+        profile = self._verbosity_profile
         
         # Class header
-        anchor = cls.get_anchor()
-        verbosity = self.config.verbosity
-        
-        if verbosity == "minimal":
-            lines.append(f"### {cls.name}")
-        elif verbosity == "standard":
-            lines.append(f"### {cls.name} {{#{anchor}}}")
-        else:  # detailed
-            lines.append(f"### Class: {cls.name} {{#{anchor}}}")
-        
-        lines.append("")
+        out.append(profile.heading.format(
+            level="###", kind="Class", name=cls.name, anchor=cls.get_anchor()
+        ))
+        out.append("")
         
         # Class docstring
         if cls.docstring:
-            lines.extend(self._format_docstring(cls.docstring))
-            lines.append("")
+            self._format_docstring(cls.docstring, out)
+            out.append("")
         
         # Inheritance
         if cls.base_classes:
             base_links = []
             for base_class in cls.base_classes:
                 # Try to link to internal base classes
-                type_resolution = self.index.resolve_type(base_class, module.name)
+                type_resolution = self._resolve_type(base_class, module.name)
                 if type_resolution and type_resolution.resolved_to:
                     ref = type_resolution.resolved_to
                     base_links.append(f"[[{ref.module}#{ref.anchor}|{base_class}]]")
                 else:
                     base_links.append(f"`{base_class}`")
             
-            lines.append(f"**Inherits from:** {', '.join(base_links)}")
-            lines.append("")
+            out.append(f"**Inherits from:** {', '.join(base_links)}")
+            out.append("")
         
         # Attributes (if any)
-        if cls.attributes and verbosity in ("standard", "detailed"):
-            lines.append("#### Attributes")
-            lines.append("")
-            for attr in cls.attributes:
-                if self._should_include_element(attr.name):
-                    lines.append(self._format_attribute(attr))
-            lines.append("")
+        if cls.attributes and profile.show_summary:
+            out.extend(_ATTRIBUTES_HEADING)
+            for attr in self._filter_visible(cls.attributes):
+                out.append(self._format_attribute(attr))
+            out.append("")
         
         # Methods
         if cls.methods:
-            lines.append("#### Methods")
-            lines.append("")
-            for method in cls.methods:
-                if self._should_include_element(method.name):
-                    lines.extend(self._generate_function_section(method, module, is_method=True))
-                    lines.append("")
-        
-        return lines
+            out.extend(_METHODS_HEADING)
+            for method in self._filter_visible(cls.methods):
+                self._generate_function_section(method, module, out, is_method=True)
+                out.append("")
     
     def _generate_function_section(
         self, 
         func: Function, 
         module: Module, 
+        out: List[str],
         is_method: bool = False
-    ) -> List[str]:
+    ) -> None:
         """Generate documentation for a function or method."""
-        lines = []
+        profile = self._verbosity_profile
+        show_summary = profile.show_summary
+        show_details = profile.show_details
         
         # Function header
-        anchor = func.get_anchor()
-        verbosity = self.config.verbosity
-        
-        if verbosity == "minimal":
-            title = func.name
-        elif verbosity == "standard":
-            title = f"{func.name} {{#{anchor}}}"
-        else:  # detailed
-            prefix = "Method" if is_method else "Function"
-            title = f"{prefix}: {func.name} {{#{anchor}}}"
-        
-        if is_method:
-            lines.append(f"##### {title}")
-        else:
-            lines.append(f"### {title}")
-        
-        lines.append("")
+        out.append(profile.heading.format(
+            level="#####" if is_method else "###",
+            kind="Method" if is_method else "Function",
+            name=func.name,
+            anchor=func.get_anchor()
+        ))
+        out.append("")
         
         # Function signature
-        if verbosity in ("standard", "detailed"):
-            lines.append(f"**Signature:** `{func.signature}`")
-            lines.append("")
+        if show_summary:
+            out.append(f"**Signature:** `{func.signature}`")
+            out.append("")
         
         # Docstring
         if func.docstring:
-            lines.extend(self._format_docstring(func.docstring))
-            lines.append("")
+            self._format_docstring(func.docstring, out)
+            out.append("")
         
         # Parameters (detailed view)
-        if verbosity == "detailed" and func.parameters:
-            lines.extend(self._generate_parameters_section(func.parameters, module))
-            lines.append("")
+        if show_details and func.parameters:
+            self._generate_parameters_section(func.parameters, module, out)
+            out.append("")
         
         # Return type
-        if func.return_type and verbosity in ("standard", "detailed"):
+        if func.return_type and show_summary:
             return_link = self._format_type_reference(func.return_type, module)
-            lines.append(f"**Returns:** {return_link}")
-            lines.append("")
+            out.append(f"**Returns:** {return_link}")
+            out.append("")
         
         # Decorators
-        if func.decorators and verbosity == "detailed":
-            lines.append("**Decorators:**")
+        if func.decorators and show_details:
+            out.append("**Decorators:**")
             for decorator in func.decorators:
-                lines.append(f"- `@{decorator.name}`")
-            lines.append("")
+                out.append(f"- `@{decorator.name}`")
+            out.append("")
         
         # Function calls (if present and detailed view)
-        if func.calls and verbosity == "detailed":
-            lines.append("**Calls:**")
+        if func.calls and show_details:
+            out.append("**Calls:**")
             for call in func.calls[:10]:  # Limit to first 10 calls
                 call_link = self._format_call_reference(call, module)
-                lines.append(f"- {call_link}")
+                out.append(f"- {call_link}")
             if len(func.calls) > 10:
-                lines.append(f"- ... and {len(func.calls) - 10} more")
-            lines.append("")
-        
-        return lines
+                out.append(f"- ... and {len(func.calls) - 10} more")
+            out.append("")
     
-    def _generate_parameters_section(self, parameters: List[Parameter], module: Module) -> List[str]:
+    def _generate_parameters_section(self, parameters: List[Parameter], module: Module, out: List[str]) -> None:
         """Generate detailed parameters section."""
-        lines = ["**Parameters:**", ""]
+        out.extend(["**Parameters:**", ""])
         
         for param in parameters:
             param_line = f"- **{param.name}**"
@@ -506,9 +521,7 @@ class ObsidianGenerator:
             if flags:
                 param_line += f" *({', '.join(flags)})*"
             
-            lines.append(param_line)
-        
-        return lines
+            out.append(param_line)
     
     def _format_attribute(self, attr) -> str:
         """Format an attribute for display."""
@@ -528,7 +541,7 @@ class ObsidianGenerator:
     def _format_type_reference(self, type_ref, module: Module) -> str:
         """Format a type reference with smart linking."""
         # Try to resolve the type
-        type_resolution = self.index.resolve_type(type_ref.name, module.name)
+        type_resolution = self._resolve_type(type_ref.name, module.name)
         
         if type_resolution and type_resolution.resolved_to:
             ref = type_resolution.resolved_to
@@ -538,101 +551,107 @@ class ObsidianGenerator:
     
     def _format_call_reference(self, call, module: Module) -> str:
         """Format a function call reference with smart linking."""
+        key = (tuple(call.call_chain), module.name)
+        link = self._call_links.get(key)
+        if link is not None:
+            return link
+        
         call_resolution = self.index.resolve_call(call.call_chain, module.name)
         
         if call_resolution and call_resolution.resolved_to and not call_resolution.is_external:
             ref = call_resolution.resolved_to
             call_name = ".".join(call.call_chain)
-            return f"[[{ref.module}#{ref.anchor}|{call_name}]]"
+            link = f"[[{ref.module}#{ref.anchor}|{call_name}]]"
         else:
-            return f"`{'.'.join(call.call_chain)}`"
+            link = f"`{'.'.join(call.call_chain)}`"
+        
+        self._call_links[key] = link
+        return link
     
-    def _format_docstring(self, docstring: str) -> List[str]:
+    def _format_docstring(self, docstring: str, out: List[str]) -> None:
         """Format a docstring for display."""
         if not docstring:
-            return []
-        
-        lines = ["> [!info] Documentation"]
-        for line in docstring.splitlines():
-            lines.append(f"> {line}")
+            return
         
-        return lines
+        out.append("> [!info] Documentation")
+        # One quoted block joined in C instead of an entry per docstring line
+        out.append("> " + "\n> ".join(docstring.splitlines()))
     
-    def _generate_source_section(self, module: Module) -> List[str]:
+    def _generate_source_section(self, module: Module, out: List[str]) -> None:
         """Generate the source code section."""
-        lines = ["## Source Code", ""]
+        out.extend(_SOURCE_HEADING)
         
         if module.source_code:
-            lines.append("```python")
-            lines.append(module.source_code)
-            lines.append("```")
+            out.extend(("```python", module.source_code, "```"))
         else:
-            lines.append("*Source code not available*")
-        
-        return lines
+            out.append("*Source code not available*")
     
-    def _generate_todos_section(self, todos: List[str]) -> List[str]:
+    def _generate_todos_section(self, todos: List[str], out: List[str]) -> None:
         """Generate the TODOs section."""
-        lines = ["## TODOs", ""]
+        out.extend(["## TODOs", ""])
         
         for todo in todos:
-            lines.append(f"- [ ] {todo}")
-        
-        return lines
+            out.append(f"- [ ] {todo}")
+    
+    def _count_totals(self, modules: List[Module]) -> Tuple[int, int, int]:
+        """Count classes, functions (including methods) and lines in one pass."""
+        total_classes = total_functions = total_lines = 0
+        for module in modules:
+            total_classes += len(module.classes)
+            total_functions += len(module.get_all_functions())
+            total_lines += module.lines_of_code
+        return total_classes, total_functions, total_lines
     
     async def _generate_dashboard(self, modules: List[Module], output_root: Path) -> None:
         """Generate the main dashboard/index file."""
         lines = ["# Codebase Documentation", ""]
         
         # Project info
-        if self.config.project.name:
-            lines.append(f"**Project:** {self.config.project.name}")
-        if self.config.project.description:
-            lines.append(f"**Description:** {self.config.project.description}")
-        lines.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        project = self.config.project
+        if project.name:
+            lines.append(f"**Project:** {project.name}")
+        if project.description:
+            lines.append(f"**Description:** {project.description}")
+        lines.append(f"**Generated:** {self._run_timestamp}")
         lines.append("")
         
         # Statistics
-        total_classes = sum(len(module.classes) for module in modules)
-        total_functions = sum(len(module.get_all_functions()) for module in modules)
-        total_lines = sum(module.lines_of_code for module in modules)
-        
-        lines.append("## Overview")
-        lines.append("")
-        lines.append(f"- **Modules:** {len(modules)}")
-        lines.append(f"- **Classes:** {total_classes}")
-        lines.append(f"- **Functions:** {total_functions}")
-        lines.append(f"- **Lines of Code:** {total_lines:,}")
-        lines.append("")
-        
-        # Module index
-        lines.append("## Modules")
-        lines.append("")
+        total_classes, total_functions, total_lines = self._count_totals(modules)
         
-        # Group by package if available
-        packages = {}
+        # Group modules by package in a single pass
+        packages: DefaultDict[str, List[Module]] = defaultdict(list)
         for module in modules:
-            package = module.package or "root"
-            if package not in packages:
-                packages[package] = []
-            packages[package].append(module)
+            packages[module.package or "root"].append(module)
+        
+        lines.extend([
+            "## Overview",
+            "",
+            f"- **Modules:** {len(modules)}",
+            f"- **Classes:** {total_classes}",
+            f"- **Functions:** {total_functions}",
+            f"- **Lines of Code:** {total_lines:,}",
+            "",
+            # Module index
+            "## Modules",
+            "",
+        ])
         
+        # Grouped by package if available
         for package, package_modules in sorted(packages.items()):
             if package != "root":
                 lines.append(f"### {package}")
                 lines.append("")
             
-            for module in sorted(package_modules, key=lambda m: m.name):
-                module_link = f"[[{module.name}]]"
-                stats = f"({len(module.classes)} classes, {len(module.functions)} functions)"
-                lines.append(f"- {module_link} {stats}")
-            
+            package_modules.sort(key=lambda m: m.name)
+            lines.extend(
+                f"- [[{m.name}]] ({len(m.classes)} classes, {len(m.functions)} functions)"
+                for m in package_modules
+            )
             lines.append("")
         
         # Write dashboard
         dashboard_path = output_root / "README.md"
-        async with aiofiles.open(dashboard_path, 'w', encoding='utf-8') as f:
-            await f.write("\n".join(lines))
+        await self._write_file(dashboard_path, "\n".join(lines))
         
         self._generated_files.add(dashboard_path)
     
@@ -642,16 +661,19 @@ class ObsidianGenerator:
             logger.debug("Mermaid generator not available, skipping visualizations")
             return
         
+        visualization = self.config.visualization
+        written: List[Path] = []
         try:
             # Create visualizations directory
             viz_dir = output_root / "_visualizations"
             viz_dir.mkdir(exist_ok=True)
             
             # Generate dependency graph
-            if self.config.visualization.generate_dependency_graph:
-                dependency_diagram = self.mermaid_generator.generate_dependency_graph(
+            if visualization.generate_dependency_graph:
+                dependency_diagram = await asyncio.to_thread(
+                    self.mermaid_generator.generate_dependency_graph,
                     modules, 
-                    exclude_external=self.config.visualization.exclude_external
+                    exclude_external=visualization.exclude_external
                 )
                 
                 content = f"""# Module Dependencies
@@ -666,17 +688,18 @@ This diagram shows the dependencies between modules in the codebase.
 - **Dotted arrows** → Inheritance relationships  
 - **Bold arrows** → Function call dependencies
 
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated on: {self._run_timestamp}
 """
                 
                 deps_file = viz_dir / "dependencies.md"
-                async with aiofiles.open(deps_file, 'w', encoding='utf-8') as f:
-                    await f.write(content)
-                self._generated_files.add(deps_file)
+                await self._write_file(deps_file, content)
+                written.append(deps_file)
             
             # Generate class hierarchy if requested
-            if self.config.visualization.generate_class_hierarchy:
-                hierarchy_diagram = self.mermaid_generator.generate_class_hierarchy(modules)
+            if visualization.generate_class_hierarchy:
+                hierarchy_diagram = await asyncio.to_thread(
+                    self.mermaid_generator.generate_class_hierarchy, modules
+                )
                 
                 content = f"""# Class Hierarchy
 
@@ -691,16 +714,18 @@ This diagram shows the inheritance relationships between classes.
 - **Orange boxes** → Exception classes
 - **Gray dashed boxes** → External classes
 
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated on: {self._run_timestamp}
 """
                 
                 hierarchy_file = viz_dir / "class_hierarchy.md"
-                async with aiofiles.open(hierarchy_file, 'w', encoding='utf-8') as f:
-                    await f.write(content)
-                self._generated_files.add(hierarchy_file)
+                await self._write_file(hierarchy_file, content)
+                written.append(hierarchy_file)
             
             # Generate module overview
-            overview_diagram = self.mermaid_generator.generate_module_overview(modules)
+            total_classes, total_functions, total_lines = self._count_totals(modules)
+            overview_diagram = await asyncio.to_thread(
+                self.mermaid_generator.generate_module_overview, modules
+            )
             
             content = f"""# Codebase Overview
 
@@ -711,22 +736,23 @@ High-level overview of the codebase structure and organization.
 ## Statistics
 
 - **Total modules:** {len(modules)}
-- **Total classes:** {sum(len(m.classes) for m in modules)}
-- **Total functions:** {sum(len(m.get_all_functions()) for m in modules)}
-- **Total lines:** {sum(m.lines_of_code for m in modules):,}
+- **Total classes:** {total_classes}
+- **Total functions:** {total_functions}
+- **Total lines:** {total_lines:,}
 
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Generated on: {self._run_timestamp}
 """
             
             overview_file = viz_dir / "overview.md"
-            async with aiofiles.open(overview_file, 'w', encoding='utf-8') as f:
-                await f.write(content)
-            self._generated_files.add(overview_file)
+            await self._write_file(overview_file, content)
+            written.append(overview_file)
             
-            logger.info(f"Generated {len(self._generated_files & {deps_file, hierarchy_file, overview_file})} visualization files")
+            logger.info(f"Generated {len(written)} visualization files")
             
         except Exception as e:
             logger.error(f"Error generating visualizations: {e}")
+        finally:
+            self._generated_files.update(written)
     
     async def _generate_event_documentation(self, output_root: Path) -> None:
         """Generate event flow documentation with visualizations."""
@@ -738,7 +764,9 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             # Generate event flow diagram
             event_diagram = ""
             if self.mermaid_generator and self.config.visualization.generate_event_flow:
-                event_diagram = self.mermaid_generator.generate_event_flow_diagram()
+                event_diagram = await asyncio.to_thread(
+                    self.mermaid_generator.generate_event_flow_diagram
+                )
             
             # Create event documentation content
             lines = [
@@ -787,13 +815,12 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             
             lines.extend([
                 "---",
-                f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+                f"Generated on: {self._run_timestamp}"
             ])
             
             # Write event documentation
             events_file = output_root / "events.md"
-            async with aiofiles.open(events_file, 'w', encoding='utf-8') as f:
-                await f.write("\n".join(lines))
+            await self._write_file(events_file, "\n".join(lines))
             
             self._generated_files.add(events_file)
             logger.info("Generated event documentation")
@@ -801,9 +828,8 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
         except Exception as e:
             logger.error(f"Error generating event documentation: {e}")
     
-    def _should_include_element(self, name: str) -> bool:
-        """Check if an element should be included based on visibility settings."""
-        if not self.config.output.include_private:
-            if name.startswith('_'):
-                return False
-        return True
\ No newline at end of file
+    def _filter_visible(self, items: List[Any]) -> List[Any]:
+        """Return the named elements that pass the visibility settings."""
+        if self._include_private:
+            return items
+        return [item for item in items if not item.name.startswith('_')]
\ No newline at end of file
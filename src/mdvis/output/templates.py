@@ -6,7 +6,7 @@ for different verbosity levels and use cases.
 """
 
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 import logging
 
 try:
@@ -18,7 +18,7 @@ except ImportError:
     Template = None
     select_autoescape = None
 
-from ..models.elements import Module, Class, Function, Parameter, ImportStatement
+from ..models.elements import Module, Class, Function
 from ..models.index import CrossReferenceIndex
 from ..utils.text_processing import (
     sanitize_anchor, generate_wikilink, format_inline_code,
@@ -28,6 +28,32 @@ from ..utils.text_processing import (
 logger = logging.getLogger(__name__)
 
 
+class _VerbosityProfile(NamedTuple):
+    """What the non-Jinja fallback renderers show at one verbosity level."""
+    heading: str  # Element heading format: level, kind, name and anchor fields
+    show_summary: bool  # Signature, return type, bases, attributes
+    show_details: bool  # Parameters, decorators, calls
+
+
+# Shared by the fallback renderers here and in the Obsidian generator;
+# unknown levels get the detailed profile
+_VERBOSITY_PROFILES = {
+    "minimal": _VerbosityProfile("{level} {name}", False, False),
+    "standard": _VerbosityProfile("{level} {name} {{#{anchor}}}", True, False),
+    "detailed": _VerbosityProfile("{level} {kind}: {name} {{#{anchor}}}", True, True),
+}
+
+
+def _verbosity_profile(verbosity: str) -> _VerbosityProfile:
+    """Fallback rendering profile for a verbosity level."""
+    return _VERBOSITY_PROFILES.get(verbosity, _VERBOSITY_PROFILES["detailed"])
+
+
+def _always_uptodate() -> bool:
+    """Freshness check for built-in templates, which never change."""
+    return True
+
+
 class TemplateManager:
     """
     Manages Jinja2 templates for different verbosity levels and output formats.
@@ -42,6 +68,8 @@ class TemplateManager:
         """
         self.verbosity = verbosity
         self.env: Optional[Environment] = None # type: ignore
+        # Resolved template per kind ("module", "class", "function")
+        self._templates: Dict[str, Template] = {} # type: ignore
         self._setup_environment()
     
     def _setup_environment(self) -> None:
@@ -54,7 +82,11 @@ class TemplateManager:
             loader=TemplateLoader(),
             autoescape=select_autoescape(['html', 'xml']),
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            # Templates are built in and never change while running, and
+            # there are few enough to keep every compiled one
+            auto_reload=False,
+            cache_size=-1
         )
         
         # Add custom filters
@@ -74,6 +106,23 @@ class TemplateManager:
             'zip': zip,
         })
     
+    def _get_template(self, kind: str) -> Template:
+        """
+        Get the compiled template for a kind of element at this verbosity,
+        falling back to the standard one. Resolved once per kind, so renders
+        skip the environment's lookup and the failed-load path for levels
+        without a dedicated template.
+        """
+        template = self._templates.get(kind)
+        if template is None:
+            try:
+                template = self.env.get_template(f"{kind}_{self.verbosity}.md.j2")
+            except Exception:
+                # Fallback to default template
+                template = self.env.get_template(f"{kind}_standard.md.j2")
+            self._templates[kind] = template
+        return template
+    
     def render_module(
         self, 
         module: Module, 
@@ -94,12 +143,7 @@ class TemplateManager:
         if self.env is None:
             return self._render_module_fallback(module, index, **kwargs)
         
-        template_name = f"module_{self.verbosity}.md.j2"
-        try:
-            template = self.env.get_template(template_name)
-        except Exception:
-            # Fallback to default template
-            template = self.env.get_template("module_standard.md.j2")
+        template = self._get_template("module")
         
         context = {
             'module': module,
@@ -132,11 +176,7 @@ class TemplateManager:
         if self.env is None:
             return self._render_class_fallback(cls, module, index, **kwargs)
         
-        template_name = f"class_{self.verbosity}.md.j2"
-        try:
-            template = self.env.get_template(template_name)
-        except Exception:
-            template = self.env.get_template("class_standard.md.j2")
+        template = self._get_template("class")
         
         context = {
             'class': cls,
@@ -172,11 +212,7 @@ class TemplateManager:
         if self.env is None:
             return self._render_function_fallback(func, module, index, is_method, **kwargs)
         
-        template_name = f"function_{self.verbosity}.md.j2"
-        try:
-            template = self.env.get_template(template_name)
-        except Exception:
-            template = self.env.get_template("function_standard.md.j2")
+        template = self._get_template("function")
         
         context = {
             'function': func,
@@ -198,45 +234,39 @@ class TemplateManager:
         **kwargs
     ) -> str:
         """Fallback module rendering without Jinja2."""
-        lines = []
-        
-        # Title
-        lines.append(f"# {module.name}")
-        lines.append("")
+        # Each block ends in a newline; blocks are separated by a blank line
+        blocks = [f"# {module.name}\n"]
         
         # Docstring
         if module.docstring:
-            lines.append(f"> {module.docstring}")
-            lines.append("")
+            blocks.append(f"> {module.docstring}\n")
         
         # Statistics
         if self.verbosity in ("standard", "detailed"):
-            lines.append("## Overview")
-            lines.append("")
-            lines.append(f"- **Classes:** {len(module.classes)}")
-            lines.append(f"- **Functions:** {len(module.functions)}")
-            lines.append(f"- **Lines of Code:** {module.lines_of_code}")
-            lines.append("")
+            blocks.append("## Overview\n")
+            blocks.append(
+                f"- **Classes:** {len(module.classes)}\n"
+                f"- **Functions:** {len(module.functions)}\n"
+                f"- **Lines of Code:** {module.lines_of_code}\n"
+            )
         
         # Classes
         if module.classes:
-            lines.append("## Classes")
-            lines.append("")
-            for cls in module.classes:
-                class_content = self._render_class_fallback(cls, module, index)
-                lines.append(class_content)
-                lines.append("")
+            blocks.append("## Classes\n")
+            blocks.extend(
+                f"{self._render_class_fallback(cls, module, index)}\n"
+                for cls in module.classes
+            )
         
         # Functions
         if module.functions:
-            lines.append("## Functions")
-            lines.append("")
-            for func in module.functions:
-                func_content = self._render_function_fallback(func, module, index, False)
-                lines.append(func_content)
-                lines.append("")
-        
-        return "\n".join(lines)
+            blocks.append("## Functions\n")
+            blocks.extend(
+                f"{self._render_function_fallback(func, module, index, False)}\n"
+                for func in module.functions
+            )
+        
+        return "\n".join(blocks)
     
     def _render_class_fallback(
         self, 
@@ -246,43 +276,38 @@ class TemplateManager:
         **kwargs
     ) -> str:
         """Fallback class rendering without Jinja2."""
-        lines = []
+        verbosity = self.verbosity
+        profile = _verbosity_profile(verbosity)
         
         # Header
-        anchor = sanitize_anchor(f"class-{cls.name}")
-        if self.verbosity == "minimal":
-            lines.append(f"### {cls.name}")
-        elif self.verbosity == "standard":
-            lines.append(f"### {cls.name} {{#{anchor}}}")
-        else:  # detailed
-            lines.append(f"### Class: {cls.name} {{#{anchor}}}")
-        
-        lines.append("")
+        blocks = [profile.heading.format(
+            level="###",
+            kind="Class",
+            name=cls.name,
+            anchor=sanitize_anchor(f"class-{cls.name}"),
+        ) + "\n"]
         
         # Docstring
         if cls.docstring:
-            if self.verbosity == "minimal":
-                lines.append(extract_summary_sentence(cls.docstring))
+            if verbosity == "minimal":
+                blocks.append(f"{extract_summary_sentence(cls.docstring)}\n")
             else:
-                lines.append(f"> {cls.docstring}")
-            lines.append("")
+                blocks.append(f"> {cls.docstring}\n")
         
         # Base classes
-        if cls.base_classes and self.verbosity in ("standard", "detailed"):
+        if cls.base_classes and profile.show_summary:
             base_links = [format_inline_code(base) for base in cls.base_classes]
-            lines.append(f"**Inherits from:** {', '.join(base_links)}")
-            lines.append("")
+            blocks.append(f"**Inherits from:** {', '.join(base_links)}\n")
         
         # Methods
-        if cls.methods and self.verbosity in ("standard", "detailed"):
-            lines.append("#### Methods")
-            lines.append("")
-            for method in cls.methods:
-                method_content = self._render_function_fallback(method, module, index, True)
-                lines.append(method_content)
-                lines.append("")
-        
-        return "\n".join(lines)
+        if cls.methods and profile.show_summary:
+            blocks.append("#### Methods\n")
+            blocks.extend(
+                f"{self._render_function_fallback(method, module, index, True)}\n"
+                for method in cls.methods
+            )
+        
+        return "\n".join(blocks)
     
     def _render_function_fallback(
         self, 
@@ -293,36 +318,30 @@ class TemplateManager:
         **kwargs
     ) -> str:
         """Fallback function rendering without Jinja2."""
-        lines = []
+        verbosity = self.verbosity
+        profile = _verbosity_profile(verbosity)
         
         # Header
-        anchor = sanitize_anchor(f"{'method' if is_method else 'function'}-{func.name}")
-        header_level = "####" if is_method else "###"
-        
-        if self.verbosity == "minimal":
-            lines.append(f"{header_level} {func.name}")
-        elif self.verbosity == "standard":
-            lines.append(f"{header_level} {func.name} {{#{anchor}}}")
-        else:  # detailed
-            prefix = "Method" if is_method else "Function"
-            lines.append(f"{header_level} {prefix}: {func.name} {{#{anchor}}}")
-        
-        lines.append("")
+        kind = "method" if is_method else "function"
+        blocks = [profile.heading.format(
+            level="####" if is_method else "###",
+            kind=kind.capitalize(),
+            name=func.name,
+            anchor=sanitize_anchor(f"{kind}-{func.name}"),
+        ) + "\n"]
         
         # Signature
-        if self.verbosity in ("standard", "detailed"):
-            lines.append(f"**Signature:** {format_inline_code(func.signature)}")
-            lines.append("")
+        if profile.show_summary:
+            blocks.append(f"**Signature:** {format_inline_code(func.signature)}\n")
         
         # Docstring
         if func.docstring:
-            if self.verbosity == "minimal":
-                lines.append(extract_summary_sentence(func.docstring))
+            if verbosity == "minimal":
+                blocks.append(f"{extract_summary_sentence(func.docstring)}\n")
             else:
-                lines.append(f"> {func.docstring}")
-            lines.append("")
+                blocks.append(f"> {func.docstring}\n")
         
-        return "\n".join(lines)
+        return "\n".join(blocks)
 
 
 class TemplateLoader(BaseLoader):
@@ -338,7 +357,7 @@ class TemplateLoader(BaseLoader):
             raise FileNotFoundError(f"Template {template} not found")
         
         source = self.templates[template]
-        return source, None, lambda: True
+        return source, None, _always_uptodate
     
     def list_templates(self):
         return list(self.templates.keys())
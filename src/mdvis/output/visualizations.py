@@ -9,7 +9,7 @@ from typing import List, Dict, Set, Optional, Tuple
 from pathlib import Path
 import logging
 
-from ..models.elements import Module, Class, Function
+from ..models.elements import Module
 from ..models.index import CrossReferenceIndex, DependencyEdge, ReferenceType
 from ..utils.text_processing import sanitize_anchor
 
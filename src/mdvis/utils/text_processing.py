@@ -4,11 +4,26 @@ Text processing utilities for mdvis.
 Common text manipulation functions used throughout the codebase.
 """
 
+import functools
 import re
 from typing import List, Optional, Tuple
 from pathlib import Path
 
+_ANCHOR_SEPARATOR_RE = re.compile(r'[_\s]+')
+_ANCHOR_INVALID_RE = re.compile(r'[^a-z0-9\-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+_SENTENCE_END_RE = re.compile(r'[.!?]+\s+')
+_CAMEL_BOUNDARY_RE = re.compile(r'([a-z])([A-Z])')
+_ACRONYM_BOUNDARY_RE = re.compile(r'([A-Z]+)([A-Z][a-z])')
+_MARKDOWN_ESCAPES = str.maketrans({
+    char: '\\' + char for char in '\\`*_{}[]()#+-.!|'
+})
 
+# Pure helpers fed the same names and docstrings many times per run are
+# memoized with functools.lru_cache; the caches live per process
+
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_anchor(text: str) -> str:
     """
     Sanitize text for use as an Obsidian anchor.
@@ -19,12 +34,19 @@ def sanitize_anchor(text: str) -> str:
     Returns:
         Sanitized anchor string
     """
+    if text.isascii() and text.isidentifier():
+        # Identifiers only need underscores turned into hyphens
+        sanitized = text.lower().replace('_', '-')
+        if '--' in sanitized:
+            sanitized = _HYPHEN_RUN_RE.sub('-', sanitized)
+        return sanitized.strip('-')
+    
     # Convert to lowercase and replace spaces/underscores with hyphens
-    sanitized = re.sub(r'[_\s]+', '-', text.lower())
+    sanitized = _ANCHOR_SEPARATOR_RE.sub('-', text.lower())
     # Remove any characters that aren't alphanumeric or hyphens
-    sanitized = re.sub(r'[^a-z0-9\-]', '', sanitized)
+    sanitized = _ANCHOR_INVALID_RE.sub('', sanitized)
     # Remove leading/trailing hyphens and collapse multiple hyphens
-    sanitized = re.sub(r'-+', '-', sanitized).strip('-')
+    sanitized = _HYPHEN_RUN_RE.sub('-', sanitized).strip('-')
     return sanitized
 
 
@@ -66,30 +88,8 @@ def escape_markdown(text: str) -> str:
     Returns:
         Escaped text safe for markdown
     """
-    # Escape common markdown special characters
-    escapes = {
-        '\\': '\\\\',
-        '`': '\\`',
-        '*': '\\*',
-        '_': '\\_',
-        '{': '\\{',
-        '}': '\\}',
-        '[': '\\[',
-        ']': '\\]',
-        '(': '\\(',
-        ')': '\\)',
-        '#': '\\#',
-        '+': '\\+',
-        '-': '\\-',
-        '.': '\\.',
-        '!': '\\!',
-        '|': '\\|'
-    }
-    
-    for char, escape in escapes.items():
-        text = text.replace(char, escape)
-    
-    return text
+    # Escape common markdown special characters in one pass
+    return text.translate(_MARKDOWN_ESCAPES)
 
 
 def format_code_block(code: str, language: str = "python") -> str:
@@ -136,6 +136,7 @@ def truncate_with_ellipsis(text: str, max_length: int = 100) -> str:
     return text[:max_length - 3] + "..."
 
 
+@functools.lru_cache(maxsize=8192)
 def extract_summary_sentence(docstring: str) -> str:
     """
     Extract the first sentence from a docstring as a summary.
@@ -150,13 +151,14 @@ def extract_summary_sentence(docstring: str) -> str:
         return ""
     
     # Split on common sentence endings
-    sentences = re.split(r'[.!?]+\s+', docstring.strip())
+    sentences = _SENTENCE_END_RE.split(docstring.strip())
     if sentences:
         return sentences[0].strip() + "."
     
     return docstring.strip()
 
 
+@functools.lru_cache(maxsize=8192)
 def humanize_identifier(identifier: str) -> str:
     """
     Convert a programming identifier to human-readable text.
@@ -171,10 +173,10 @@ def humanize_identifier(identifier: str) -> str:
     text = identifier.replace('_', ' ')
     
     # Handle camelCase and PascalCase
-    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+    text = _CAMEL_BOUNDARY_RE.sub(r'\1 \2', text)
     
     # Handle acronyms (e.g., XMLParser -> XML Parser)
-    text = re.sub(r'([A-Z]+)([A-Z][a-z])', r'\1 \2', text)
+    text = _ACRONYM_BOUNDARY_RE.sub(r'\1 \2', text)
     
     return text.strip()
 
@@ -203,7 +205,7 @@ def count_non_empty_lines(text: str) -> int:
     Returns:
         Number of non-empty lines
     """
-    return len([line for line in text.splitlines() if line.strip()])
+    return sum(1 for line in text.splitlines() if line and not line.isspace())
 
 
 def relative_path_to_link(source_path: Path, target_path: Path) -> str: